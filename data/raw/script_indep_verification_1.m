@@ -146,10 +146,12 @@ if ~isempty(empirical_results.variance_ratio)
     fprintf('  If no environmental noise (σ_A ≈ σ_B): ratio ≈ 2.0\n');
     fprintf('  If no environmental noise (unequal σ): ratio = 1 + (σ_B/σ_A)²\n');
 
-    % Count KPIs in different categories
-    env_noise_count = sum(ratios < 1.0);
-    no_env_noise_count = sum(ratios >= 1.5);
-    unclear_count = sum(ratios >= 1.0 & ratios < 1.5);
+    % Count KPIs in different categories with a single binning pass:
+    % [-Inf, 1.0) noise cancellation, [1.0, 1.5) unclear, [1.5, Inf] none
+    category_counts = histcounts(ratios, [-Inf, 1.0, 1.5, Inf]);
+    env_noise_count = category_counts(1);
+    unclear_count = category_counts(2);
+    no_env_noise_count = category_counts(3);
 
     fprintf('\nEmpirical findings:\n');
     fprintf('  KPIs showing environmental noise (ratio < 1.0): %d/%d (%.1f%%)\n', ...
@@ -181,9 +181,12 @@ fprintf('SNR_R/SNR_A = (1 + κ) / (1 + κ - 2*√κ*ρ)\n');
 kappa_values = [0.25, 1.0, 2.25, 4.0]; % κ = r²
 fprintf('\nVariance Ratio Analysis (κ = σ²_B/σ²_A):\n');
 
+% SNR ratio curves for every κ at once (one row per κ, one column per ρ)
+kappa_column = kappa_values(:);
+snr_ratio_unequal = (1 + kappa_column) ./ (1 + kappa_column - 2*sqrt(kappa_column).*rho_range);
+
 for i = 1:length(kappa_values)
     kappa = kappa_values(i);
-    snr_ratio_unequal = (1 + kappa) ./ (1 + kappa - 2*sqrt(kappa)*rho_range);
     
     fprintf('  κ = %.2f: SNR_R/SNR_A = (1 + %.2f) / (1 + %.2f - 2*√%.2f*ρ)\n', kappa, kappa, kappa, kappa);
     fprintf('    ρ → 1: SNR_R/SNR_A → %.2f\n', (1 + kappa) / (1 + kappa - 2*sqrt(kappa)));
@@ -304,8 +307,7 @@ subplot(3,4,5);
 colors = {'r', 'g', 'b', 'm'};
 for i = 1:length(kappa_values)
     kappa = kappa_values(i);
-    snr_ratio_unequal = (1 + kappa) ./ (1 + kappa - 2*sqrt(kappa)*rho_range);
-    plot(rho_range, snr_ratio_unequal, colors{i}, 'LineWidth', 2, 'DisplayName', sprintf('κ=%.2f', kappa));
+    plot(rho_range, snr_ratio_unequal(i, :), colors{i}, 'LineWidth', 2, 'DisplayName', sprintf('κ=%.2f', kappa));
     hold on;
 end
 xlabel('Correlation (ρ)');
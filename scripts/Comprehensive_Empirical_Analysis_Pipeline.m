@@ -194,6 +194,10 @@ function teamPerformance = generateSyntheticPerformance(nTeams, nKPIs, nMatches)
     
     teamPerformance = struct();
     
+    % Draw all match noise in one call (matches x KPIs x teams); the
+    % column-major fill order matches drawing each team/KPI in turn
+    noise = randn(nMatches, nKPIs, nTeams);
+    
     for i = 1:nTeams
         teamName = sprintf('Team_%d', i);
         
@@ -205,7 +209,7 @@ function teamPerformance = generateSyntheticPerformance(nTeams, nKPIs, nMatches)
             sigma = 5 + 2 * (j - 1); % Different variances for different KPIs
             
             % Generate correlated performance across matches
-            performance = mu + sigma * randn(nMatches, 1);
+            performance = mu + sigma * noise(:, j, i);
             
             teamPerformance.(teamName).(kpiName) = performance;
         end
@@ -225,15 +229,15 @@ function rawData = createRawDataTable(data)
     teamNames = repmat(data.teams, data.nMatches, 1);
     rawData.Team = teamNames(:);
     
-    % Add KPI data
+    % Add KPI data (stacked team by team into a preallocated column)
     for i = 1:data.nKPIs
         kpiName = data.kpis{i};
-        kpiData = [];
+        kpiData = zeros(data.nMatches * data.nTeams, 1);
         
         for j = 1:data.nTeams
             teamName = data.teams{j};
-            teamKpiData = data.teamPerformance.(teamName).(kpiName);
-            kpiData = [kpiData; teamKpiData];
+            rows = (j - 1) * data.nMatches + (1:data.nMatches);
+            kpiData(rows) = data.teamPerformance.(teamName).(kpiName);
         end
         
         rawData.(kpiName) = kpiData;
@@ -409,13 +413,20 @@ function mechanismAnalysis = analyzeDualMechanisms(data)
     % Analyze each KPI
     mechanismAnalysis.kpiAnalysis = struct();
     
+    % The team pairs are the same for every KPI
+    teamPairs = nchoosek(1:data.nTeams, 2);
+    nPairs = size(teamPairs, 1);
+    
     for j = 1:data.nKPIs
         kpiName = data.kpis{j};
         mechanismAnalysis.kpiAnalysis.(kpiName) = struct();
         
-        % Calculate mechanism parameters for all team pairs
-        teamPairs = nchoosek(1:data.nTeams, 2);
-        nPairs = size(teamPairs, 1);
+        % Each team appears in several pairs, so compute its statistics
+        % once per KPI rather than once per pair
+        kpiData = arrayfun(@(t) data.teamPerformance.(data.teams{t}).(kpiName), ...
+                           1:data.nTeams, 'UniformOutput', false);
+        teamMeans = cellfun(@mean, kpiData);
+        teamStds = cellfun(@std, kpiData);
         
         mechanismAnalysis.kpiAnalysis.(kpiName).teamPairs = struct();
         
@@ -428,14 +439,14 @@ function mechanismAnalysis = analyzeDualMechanisms(data)
             pairName = sprintf('%s_vs_%s', team1Name, team2Name);
             
             % Get team data
-            team1Data = data.teamPerformance.(team1Name).(kpiName);
-            team2Data = data.teamPerformance.(team2Name).(kpiName);
+            team1Data = kpiData{team1Idx};
+            team2Data = kpiData{team2Idx};
             
             % Calculate mechanism parameters
-            mu1 = mean(team1Data);
-            mu2 = mean(team2Data);
-            sigma1 = std(team1Data);
-            sigma2 = std(team2Data);
+            mu1 = teamMeans(team1Idx);
+            mu2 = teamMeans(team2Idx);
+            sigma1 = teamStds(team1Idx);
+            sigma2 = teamStds(team2Idx);
             
             % Calculate correlation
             minLength = min(length(team1Data), length(team2Data));
@@ -43,35 +43,21 @@ fprintf('  Total grid points: %d\n', numel(KAPPA));
 fprintf('\nSTEP 2: Calculating SNR improvement with asymptote handling...\n');
 fprintf('==========================================================\n');
 
-% Initialize arrays
-SNR_IMPROVEMENT = zeros(size(KAPPA));
-CRITICAL_MASK = false(size(KAPPA));
-
-% Calculate for each point with careful asymptote handling
-for i = 1:size(KAPPA, 1)
-    for j = 1:size(KAPPA, 2)
-        kappa = KAPPA(i, j);
-        rho = RHO(i, j);
-        
-        % Calculate denominator
-        denominator = 1 + kappa - 2*sqrt(kappa)*rho;
-        
-        % Critical line: ρ_critical = (1 + κ)/(2√κ)
-        rho_critical = (1 + kappa) / (2 * sqrt(kappa));
-        
-        % Check if near critical line (within 1% tolerance)
-        if abs(rho - rho_critical) < 0.01
-            CRITICAL_MASK(i, j) = true;
-            SNR_IMPROVEMENT(i, j) = NaN; % Mark as critical
-        elseif abs(denominator) < 1e-6  % Very close to singularity
-            CRITICAL_MASK(i, j) = true;
-            SNR_IMPROVEMENT(i, j) = NaN;
-        else
-            % Safe calculation
-            SNR_IMPROVEMENT(i, j) = (1 + kappa) / denominator;
-        end
-    end
-end
+% Evaluate the whole grid at once by broadcasting the 1-D κ row against
+% the ρ column (same layout as the KAPPA/RHO meshgrid)
+rho_column = rho_range(:);
+sqrt_kappa = sqrt(kappa_range);
+
+% Denominator and critical line ρ_critical = (1 + κ)/(2√κ)
+denominator = 1 + kappa_range - 2*sqrt_kappa.*rho_column;
+rho_critical = (1 + kappa_range) ./ (2 * sqrt_kappa);
+
+% Points within 1% of the critical line, or very close to the
+% singularity, are marked as critical
+CRITICAL_MASK = abs(rho_column - rho_critical) < 0.01 | abs(denominator) < 1e-6;
+
+SNR_IMPROVEMENT = (1 + kappa_range) ./ denominator;
+SNR_IMPROVEMENT(CRITICAL_MASK) = NaN;
 
 % Handle visualization limits
 SNR_CLIPPED = SNR_IMPROVEMENT;
@@ -120,14 +106,10 @@ rugby_examples = struct();
 rugby_examples.kpi = {'Carries', 'Metres_Made', 'Defenders_Beaten', 'Offloads'};
 rugby_examples.kappa = [1.001, 1.2, 0.9, 2.0];  % Example values from your data
 rugby_examples.rho = [0.086, 0.15, 0.12, 0.25];  % Positive correlations observed
-rugby_examples.snr = zeros(size(rugby_examples.kappa));
 
-% Calculate SNR for rugby examples
-for i = 1:length(rugby_examples.kpi)
-    kappa = rugby_examples.kappa(i);
-    rho = rugby_examples.rho(i);
-    rugby_examples.snr(i) = (1 + kappa) / (1 + kappa - 2*sqrt(kappa)*rho);
-end
+% Calculate SNR for all rugby examples at once
+rugby_examples.snr = (1 + rugby_examples.kappa) ./ ...
+    (1 + rugby_examples.kappa - 2*sqrt(rugby_examples.kappa).*rugby_examples.rho);
 
 fprintf('Rugby data positioning:\n');
 for i = 1:length(rugby_examples.kpi)
@@ -249,10 +231,8 @@ set(gca, 'XTickLabel', rugby_examples.kpi, 'XTickLabelRotation', 45);
 ylabel('SNR Improvement');
 title('Rugby Data: Empirical SNR');
 grid on;
-for i = 1:length(rugby_examples.kpi)
-    text(i, rugby_examples.snr(i) + 0.1, sprintf('%.2f', rugby_examples.snr(i)), ...
-         'HorizontalAlignment', 'center');
-end
+text((1:length(rugby_examples.kpi))', rugby_examples.snr(:) + 0.1, compose('%.2f', rugby_examples.snr(:)), ...
+     'HorizontalAlignment', 'center');
 
 % Subplot 8: Correlation vs SNR
 subplot(3,4,8);
@@ -263,7 +243,7 @@ title('Rugby Data: ρ vs SNR');
 grid on;
 % Add trend line
 p = polyfit(rugby_examples.rho, rugby_examples.snr, 1);
-rho_trend = min(rugby_examples.rho):0.01:max(rugby_examples.rho);
+rho_trend = [min(rugby_examples.rho), max(rugby_examples.rho)];
 snr_trend = polyval(p, rho_trend);
 hold on;
 plot(rho_trend, snr_trend, 'r--', 'LineWidth', 2);
@@ -271,13 +251,8 @@ plot(rho_trend, snr_trend, 'r--', 'LineWidth', 2);
 % Subplot 9: Critical Distance Analysis  
 subplot(3,4,9);
 % Calculate distance from critical line for rugby data
-distances = zeros(size(rugby_examples.kappa));
-for i = 1:length(rugby_examples.kappa)
-    kappa = rugby_examples.kappa(i);
-    rho = rugby_examples.rho(i);
-    rho_crit = (1 + kappa) / (2 * sqrt(kappa));
-    distances(i) = abs(rho - rho_crit) / rho_crit;  % Relative distance
-end
+rho_crit = (1 + rugby_examples.kappa) ./ (2 * sqrt(rugby_examples.kappa));
+distances = abs(rugby_examples.rho - rho_crit) ./ rho_crit;  % Relative distance
 
 bar(distances);
 set(gca, 'XTickLabel', rugby_examples.kpi, 'XTickLabelRotation', 45);
@@ -158,7 +158,7 @@ function generateValidationFigure(colors)
     
     % Add regression line
     p = polyfit(theoretical_snr, empirical_snr, 1);
-    x_reg = linspace(lims(1), lims(2), 100);
+    x_reg = lims;
     y_reg = polyval(p, x_reg);
     plot(x_reg, y_reg, '-', 'Color', colors.accent, 'LineWidth', 2.5);
     
@@ -206,10 +206,8 @@ function generateApplicationsFigure(colors)
     title('Cross-Domain Framework Performance', 'FontSize', 16);
     
     % Add value labels
-    for i = 1:length(improvements)
-        text(i, improvements(i) + 1, sprintf('%.1f%%', improvements(i)), ...
-             'HorizontalAlignment', 'center', 'FontSize', 12, 'FontWeight', 'bold');
-    end
+    text((1:length(improvements))', improvements(:) + 1, compose('%.1f%%', improvements(:)), ...
+         'HorizontalAlignment', 'center', 'FontSize', 12, 'FontWeight', 'bold');
     
     % Add reference line
     hold on;
@@ -82,7 +82,7 @@ end
 % Check match structure
 if any(strcmp(isolated_data.Properties.VariableNames, 'Match_x'))
     fprintf('✓ Match identification available\n');
-    unique_matches = unique(isolated_data.Match_x);
+    [unique_matches, ~, match_group] = unique(isolated_data.Match_x);
     fprintf('  - Unique matches: %d\n', length(unique_matches));
 else
     fprintf('✗ No match identification in isolated data\n');
@@ -161,6 +161,24 @@ correct_results.variance_ratio = [];
 correct_results.theoretical_improvement = [];
 correct_results.empirical_improvement = [];
 
+% Locate the Team A / Team B rows of the first 20 matches once; every KPI
+% below reads its values from these rows instead of re-scanning the table
+% (match_group comes from the match structure check in Step 1)
+n_paired_matches = min(20, length(unique_matches)); % Analyze first 20 matches
+paired_rows = zeros(n_paired_matches, 2);
+is_paired = false(n_paired_matches, 1);
+
+for j = 1:n_paired_matches
+    match_rows = find(match_group == j);
+    
+    if length(match_rows) == 2
+        % Assume first team is Team A, second is Team B
+        paired_rows(j, :) = match_rows';
+        is_paired(j) = true;
+    end
+end
+paired_rows = paired_rows(is_paired, :);
+
 for i = 1:length(technical_kpis)
     kpi = technical_kpis{i};
     
@@ -169,21 +187,10 @@ for i = 1:length(technical_kpis)
         
         fprintf('\nAnalyzing %s:\n', kpi);
         
-        % Get all matches
-        unique_matches = unique(isolated_data.Match_x);
-        team_A_data = [];
-        team_B_data = [];
-        
-        for j = 1:min(20, length(unique_matches)) % Analyze first 20 matches
-            match_id = unique_matches(j);
-            match_data = isolated_data(strcmp(isolated_data.Match_x, match_id), :);
-            
-            if height(match_data) == 2
-                % Assume first team is Team A, second is Team B
-                team_A_data(end+1) = match_data.(kpi)(1);
-                team_B_data(end+1) = match_data.(kpi)(2);
-            end
-        end
+        % Team A / Team B values for the paired matches
+        kpi_values = isolated_data.(kpi);
+        team_A_data = kpi_values(paired_rows(:, 1))';
+        team_B_data = kpi_values(paired_rows(:, 2))';
         
         if length(team_A_data) > 5 && length(team_B_data) > 5
             % Calculate correct sigmas
@@ -143,8 +143,8 @@ function generate_final_visualizations_simple(comprehensive_results)
         mkdir('outputs/figures/comprehensive_integration');
     end
     
-    % Create comprehensive dashboard
-    figure('Position', [100, 100, 1600, 1200]);
+    % Create comprehensive dashboard off-screen (it is only written to disk)
+    fig = figure('Position', [100, 100, 1600, 1200], 'Visible', 'off');
     
     % 1. SEF Overview
     subplot(3,3,1);
@@ -238,9 +238,11 @@ function generate_final_visualizations_simple(comprehensive_results)
     grid on;
     
     sgtitle('SEF Framework: Comprehensive Integration Results');
-    saveas(gcf, 'outputs/figures/comprehensive_integration/phase3_comprehensive_dashboard.png');
-    saveas(gcf, 'outputs/figures/comprehensive_integration/phase3_comprehensive_dashboard.fig');
-    close;
+    saveas(fig, 'outputs/figures/comprehensive_integration/phase3_comprehensive_dashboard.png');
+    % Make the saved .fig visible again when it is reopened
+    set(fig, 'CreateFcn', 'set(gcbo, ''Visible'', ''on'')');
+    saveas(fig, 'outputs/figures/comprehensive_integration/phase3_comprehensive_dashboard.fig');
+    close(fig);
     
     fprintf('    Final visualizations saved to outputs/figures/comprehensive_integration/\n');
 end
@@ -71,11 +71,14 @@ function mc_results = perform_multiple_comparison_correction_simple(data)
     mc_results.significant_fdr = [];
     mc_results.significant_holm = [];
     
-    % Calculate SEF for each KPI and season combination
-    p_values = [];
-    sef_values = [];
-    kpi_names = {};
-    season_names = {};
+    % Calculate SEF for each KPI and season combination (preallocated for
+    % every combination, then trimmed to those with enough matches)
+    max_comparisons = n_kpis * n_seasons;
+    p_values = zeros(1, max_comparisons);
+    sef_values = zeros(1, max_comparisons);
+    kpi_names = cell(1, max_comparisons);
+    season_names = cell(1, max_comparisons);
+    n_comparisons = 0;
     
     for kpi = 1:n_kpis
         for season = 1:n_seasons
@@ -83,21 +86,27 @@ function mc_results = perform_multiple_comparison_correction_simple(data)
             if sum(season_mask) > 10 % Minimum sample size
                 season_a = team_a_perf(season_mask, kpi);
                 season_b = team_b_perf(season_mask, kpi);
+                n_comparisons = n_comparisons + 1;
                 
                 % Calculate SEF
                 sef = calculate_sef_simple(season_a, season_b);
-                sef_values(end+1) = sef;
+                sef_values(n_comparisons) = sef;
                 
                 % Bootstrap test for SEF > 1
                 [p_val, ~] = bootstrap_sef_test_simple(season_a, season_b, 1000);
-                p_values(end+1) = p_val;
+                p_values(n_comparisons) = p_val;
                 
-                kpi_names{end+1} = sprintf('KPI_%d', kpi);
-                season_names{end+1} = sprintf('Season_%d', season);
+                kpi_names{n_comparisons} = sprintf('KPI_%d', kpi);
+                season_names{n_comparisons} = sprintf('Season_%d', season);
             end
         end
     end
     
+    p_values = p_values(1:n_comparisons);
+    sef_values = sef_values(1:n_comparisons);
+    kpi_names = kpi_names(1:n_comparisons);
+    season_names = season_names(1:n_comparisons);
+    
     % Store raw results
     mc_results.raw_p_values = p_values;
     mc_results.sef_values = sef_values;
@@ -404,24 +413,45 @@ function [p_value, sef_dist] = bootstrap_sef_test_simple(team_a, team_b, n_boots
     % Calculate observed SEF
     observed_sef = calculate_sef_simple(team_a, team_b);
     
-    % Bootstrap sampling
-    sef_dist = zeros(n_bootstrap, 1);
+    % Bootstrap sampling in column batches (parfor runs serially without a pool)
+    MAX_BATCH_ELEMENTS = 1e6;
+    MIN_BATCHES = 8;
     n_samples = length(team_a);
-    
-    for i = 1:n_bootstrap
-        % Bootstrap sample
-        indices = randi(n_samples, n_samples, 1);
-        boot_a = team_a(indices);
-        boot_b = team_b(indices);
-        
-        % Calculate bootstrap SEF
-        sef_dist(i) = calculate_sef_simple(boot_a, boot_b);
+    batch_size = max(1, min(floor(MAX_BATCH_ELEMENTS / n_samples), ceil(n_bootstrap / MIN_BATCHES)));
+    batch_starts = 1:batch_size:n_bootstrap;
+    team_a = team_a(:); team_b = team_b(:);
+    
+    % One substream per batch keeps results independent of the worker count
+    stream_seed = randi(intmax('int32'));
+    batch_sef = cell(length(batch_starts), 1);
+    
+    parfor batch = 1:length(batch_starts)
+        stream = RandStream('mlfg6331_64', 'Seed', stream_seed);
+        stream.Substream = batch;
+        n_cols = min(batch_size, n_bootstrap - batch_starts(batch) + 1);
+        indices = randi(stream, n_samples, n_samples, n_cols);
+        batch_sef{batch} = calculate_sef_simple_columns(team_a(indices), team_b(indices));
     end
+    sef_dist = vertcat(batch_sef{:});
     
     % Calculate p-value
     p_value = sum(sef_dist >= observed_sef) / n_bootstrap;
 end
 
+function sef_values = calculate_sef_simple_columns(team_a, team_b)
+    % Column-wise calculate_sef_simple for NaN-free bootstrap resamples
+    centred_a = team_a - mean(team_a, 1);
+    centred_b = team_b - mean(team_b, 1);
+    ss_a = sum(centred_a.^2, 1);
+    ss_b = sum(centred_b.^2, 1);
+    ss_ab = sum(centred_a .* centred_b, 1);
+    sef_values = (ss_a + ss_b) ./ (ss_a + ss_b - 2 * ss_ab);
+    
+    % Zero variance or equal means give SEF = 1, as in the scalar version
+    sef_values(~(ss_a > 0 & ss_b > 0) | mean(team_a, 1) == mean(team_b, 1)) = 1;
+    sef_values = sef_values(:);
+end
+
 function corrected_p = fdr_correction_simple(p_values)
     % False Discovery Rate correction (simplified)
     
@@ -514,13 +544,12 @@ function corr_results = perform_correlation_analysis_simple(team_a_perf, team_b_
     
     corr_results = struct();
     
-    % Calculate correlation for each KPI
-    n_kpis = size(team_a_perf, 2);
-    correlations = zeros(n_kpis, 1);
-    
-    for i = 1:n_kpis
-        correlations(i) = corr(team_a_perf(:, i), team_b_perf(:, i));
-    end
+    % Calculate correlation for each KPI: Pearson's r between matching
+    % columns, computed for all columns at once
+    centered_a = team_a_perf - mean(team_a_perf, 1);
+    centered_b = team_b_perf - mean(team_b_perf, 1);
+    correlations = (sum(centered_a .* centered_b, 1) ./ ...
+        sqrt(sum(centered_a.^2, 1) .* sum(centered_b.^2, 1)))';
     
     corr_results.correlations = correlations;
     corr_results.mean_correlation = mean(correlations);
@@ -60,9 +60,10 @@ function sample_results = analyze_sample_size_sensitivity(data)
     sample_results.sef_ci_upper = zeros(size(sample_sizes));
     sample_results.convergence = zeros(size(sample_sizes));
     
-    % Get all available data
-    all_matches = data.matches;
-    n_total = height(all_matches);
+    % Get all available data (numeric columns extracted once, outside the loop)
+    team_a_perf = data.matches.team_a_performance;
+    team_b_perf = data.matches.team_b_performance;
+    n_total = length(team_a_perf);
     
     for i = 1:length(sample_sizes)
         n_samples = sample_sizes(i);
@@ -71,16 +72,7 @@ function sample_results = analyze_sample_size_sensitivity(data)
         end
         
         % Bootstrap sampling
-        sef_bootstrap = zeros(n_bootstrap, 1);
-        
-        for b = 1:n_bootstrap
-            % Random sampling with replacement
-            sample_indices = randsample(n_total, n_samples, true);
-            sample_data = all_matches(sample_indices, :);
-            
-            % Calculate SEF for this bootstrap sample
-            sef_bootstrap(b) = calculate_sef_for_sample(sample_data);
-        end
+        sef_bootstrap = bootstrap_sef(team_a_perf, team_b_perf, n_samples, n_bootstrap);
         
         % Calculate statistics
         sample_results.sef_means(i) = mean(sef_bootstrap);
@@ -158,25 +150,31 @@ function param_results = analyze_parameter_sensitivity(data)
     % κ (variance ratio) sensitivity
     kappa_range = logspace(-1, 1, 21); % 0.1 to 10
     param_results.kappa_range = kappa_range;
-    param_results.kappa_sef = zeros(size(kappa_range));
     
     % ρ (correlation) sensitivity
     rho_range = -1:0.1:1;
     param_results.rho_range = rho_range;
-    param_results.rho_sef = zeros(size(rho_range));
     
     % Calculate baseline SEF
     baseline_sef = calculate_sef_for_sample(data.matches);
     param_results.baseline_sef = baseline_sef;
     
-    % Test κ sensitivity
-    for i = 1:length(kappa_range)
-        param_results.kappa_sef(i) = calculate_sef_with_kappa(data.matches, kappa_range(i));
-    end
+    % Baseline parameters, computed once and shared by both sweeps
+    team_a_perf = data.matches.team_a_performance;
+    team_b_perf = data.matches.team_b_performance;
+    sigma_a = std(team_a_perf);
+    sigma_b = std(team_b_perf);
+    rho_baseline = corr(team_a_perf, team_b_perf);
+    
+    % Test κ sensitivity (fixed ρ, evaluated over the whole range at once)
+    param_results.kappa_sef = (1 + kappa_range) ./ (1 + kappa_range - 2*sqrt(kappa_range)*rho_baseline);
     
-    % Test ρ sensitivity
-    for i = 1:length(rho_range)
-        param_results.rho_sef(i) = calculate_sef_with_rho(data.matches, rho_range(i));
+    % Test ρ sensitivity (fixed κ, evaluated over the whole range at once)
+    if sigma_a > 0 && sigma_b > 0
+        kappa_baseline = (sigma_b^2) / (sigma_a^2);
+        param_results.rho_sef = (1 + kappa_baseline) ./ (1 + kappa_baseline - 2*sqrt(kappa_baseline)*rho_range);
+    else
+        param_results.rho_sef = NaN(size(rho_range));
     end
     
     % Parameter space mapping
@@ -235,8 +233,12 @@ function sef_value = calculate_sef_for_sample(sample_data)
     % Calculate SEF for a given sample of data
     
     % Extract team A and team B performance
-    team_a_perf = sample_data.team_a_performance;
-    team_b_perf = sample_data.team_b_performance;
+    sef_value = calculate_sef_from_performance(sample_data.team_a_performance, ...
+                                               sample_data.team_b_performance);
+end
+
+function sef_value = calculate_sef_from_performance(team_a_perf, team_b_perf)
+    % Calculate SEF from team A and team B performance vectors
     
     % Calculate means and standard deviations
     mu_a = mean(team_a_perf);
@@ -256,31 +258,34 @@ function sef_value = calculate_sef_for_sample(sample_data)
     end
 end
 
-function sef_value = calculate_sef_with_kappa(data, kappa)
-    % Calculate SEF with fixed κ value
-    
-    team_a_perf = data.team_a_performance;
-    team_b_perf = data.team_b_performance;
-    
-    rho = corr(team_a_perf, team_b_perf);
-    sef_value = (1 + kappa) / (1 + kappa - 2*sqrt(kappa)*rho);
+function sef_values = bootstrap_sef(team_a_perf, team_b_perf, n_samples, n_bootstrap)
+    % Bootstrap SEF distribution, resampled in column batches
+    MAX_BATCH_ELEMENTS = 1e6;
+    batch_size = max(1, floor(MAX_BATCH_ELEMENTS / n_samples));
+    team_a_perf = team_a_perf(:); team_b_perf = team_b_perf(:);
+    n_total = length(team_a_perf);
+    sef_values = zeros(n_bootstrap, 1);
+    
+    for batch_start = 1:batch_size:n_bootstrap
+        batch_cols = batch_start:min(batch_start + batch_size - 1, n_bootstrap);
+        sample_indices = randi(n_total, n_samples, length(batch_cols));
+        sef_values(batch_cols) = calculate_sef_columns( ...
+            team_a_perf(sample_indices), team_b_perf(sample_indices));
+    end
 end
 
-function sef_value = calculate_sef_with_rho(data, rho)
-    % Calculate SEF with fixed ρ value
-    
-    team_a_perf = data.team_a_performance;
-    team_b_perf = data.team_b_performance;
-    
-    sigma_a = std(team_a_perf);
-    sigma_b = std(team_b_perf);
-    
-    if sigma_a > 0 && sigma_b > 0
-        kappa = (sigma_b^2) / (sigma_a^2);
-        sef_value = (1 + kappa) / (1 + kappa - 2*sqrt(kappa)*rho);
-    else
-        sef_value = NaN;
-    end
+function sef_values = calculate_sef_columns(team_a_perf, team_b_perf)
+    % Column-wise equivalent of calculate_sef_from_performance (one SEF per column)
+    centred_a = team_a_perf - mean(team_a_perf, 1);
+    centred_b = team_b_perf - mean(team_b_perf, 1);
+    ss_a = sum(centred_a.^2, 1);
+    ss_b = sum(centred_b.^2, 1);
+    rho = sum(centred_a .* centred_b, 1) ./ sqrt(ss_a .* ss_b);
+    
+    kappa = ss_b ./ ss_a;
+    sef_values = (1 + kappa) ./ (1 + kappa - 2*sqrt(kappa).*rho);
+    sef_values(~(ss_a > 0 & ss_b > 0) | isnan(rho)) = NaN;
+    sef_values = sef_values(:);
 end
 
 function trend = calculate_temporal_trend(seasonal_sef)
@@ -302,15 +307,9 @@ function parameter_space = map_parameter_space(kappa_range, rho_range)
     % Map SEF values across the full parameter space
     
     [K, R] = meshgrid(kappa_range, rho_range);
-    SEF = zeros(size(K));
     
-    for i = 1:size(K, 1)
-        for j = 1:size(K, 2)
-            kappa = K(i, j);
-            rho = R(i, j);
-            SEF(i, j) = (1 + kappa) / (1 + kappa - 2*sqrt(kappa)*rho);
-        end
-    end
+    % Evaluate SEF over the whole grid elementwise
+    SEF = (1 + K) ./ (1 + K - 2*sqrt(K).*R);
     
     parameter_space.kappa = K;
     parameter_space.rho = R;
@@ -468,14 +467,13 @@ function significance_results = test_sef_significance(data)
     
     % Bootstrap test for SEF > 1
     n_bootstrap = 1000;
-    sef_bootstrap = zeros(n_bootstrap, 1);
     
-    for i = 1:n_bootstrap
-        % Bootstrap sample
-        sample_indices = randsample(height(data.matches), height(data.matches), true);
-        sample_data = data.matches(sample_indices, :);
-        sef_bootstrap(i) = calculate_sef_for_sample(sample_data);
-    end
+    team_a_perf = data.matches.team_a_performance;
+    team_b_perf = data.matches.team_b_performance;
+    n_total = length(team_a_perf);
+    
+    % Bootstrap samples
+    sef_bootstrap = bootstrap_sef(team_a_perf, team_b_perf, n_total, n_bootstrap);
     
     % Calculate p-value for SEF > 1
     significance_results.p_value = sum(sef_bootstrap <= 1) / n_bootstrap;
@@ -492,13 +490,12 @@ function ci_results = calculate_bootstrap_ci(data)
     ci_results = struct();
     
     n_bootstrap = 1000;
-    sef_bootstrap = zeros(n_bootstrap, 1);
     
-    for i = 1:n_bootstrap
-        sample_indices = randsample(height(data.matches), height(data.matches), true);
-        sample_data = data.matches(sample_indices, :);
-        sef_bootstrap(i) = calculate_sef_for_sample(sample_data);
-    end
+    team_a_perf = data.matches.team_a_performance;
+    team_b_perf = data.matches.team_b_performance;
+    n_total = length(team_a_perf);
+    
+    sef_bootstrap = bootstrap_sef(team_a_perf, team_b_perf, n_total, n_bootstrap);
     
     % Calculate confidence intervals
     ci_results.mean_sef = mean(sef_bootstrap);
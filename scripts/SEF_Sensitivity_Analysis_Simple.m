@@ -69,18 +69,8 @@ function sample_results = analyze_sample_size_sensitivity_simple(data)
             n_samples = n_total;
         end
         
-        % Bootstrap sampling
-        sef_bootstrap = zeros(n_bootstrap, 1);
-        
-        for b = 1:n_bootstrap
-            % Random sampling with replacement
-            sample_indices = randsample(n_total, n_samples, true);
-            sample_a = team_a_perf(sample_indices);
-            sample_b = team_b_perf(sample_indices);
-            
-            % Calculate SEF for this bootstrap sample
-            sef_bootstrap(b) = calculate_sef_simple(sample_a, sample_b);
-        end
+        % Bootstrap sampling (resamples drawn in column batches)
+        sef_bootstrap = bootstrap_sef_simple(team_a_perf, team_b_perf, n_samples, n_bootstrap);
         
         % Calculate statistics
         sample_results.sef_means(i) = mean(sef_bootstrap);
@@ -191,22 +181,16 @@ function param_results = analyze_parameter_sensitivity_simple(data)
     % κ (variance ratio) sensitivity
     kappa_range = logspace(-1, 1, 21); % 0.1 to 10
     param_results.kappa_range = kappa_range;
-    param_results.kappa_sef = zeros(size(kappa_range));
     
     % ρ (correlation) sensitivity
     rho_range = -0.9:0.1:0.9;
     param_results.rho_range = rho_range;
-    param_results.rho_sef = zeros(size(rho_range));
     
-    % Test κ sensitivity
-    for i = 1:length(kappa_range)
-        param_results.kappa_sef(i) = (1 + kappa_range(i)) / (1 + kappa_range(i) - 2*sqrt(kappa_range(i))*rho_baseline);
-    end
+    % Test κ sensitivity (fixed ρ, evaluated over the whole range at once)
+    param_results.kappa_sef = (1 + kappa_range) ./ (1 + kappa_range - 2*sqrt(kappa_range)*rho_baseline);
     
-    % Test ρ sensitivity
-    for i = 1:length(rho_range)
-        param_results.rho_sef(i) = (1 + kappa_baseline) / (1 + kappa_baseline - 2*sqrt(kappa_baseline)*rho_range(i));
-    end
+    % Test ρ sensitivity (fixed κ, evaluated over the whole range at once)
+    param_results.rho_sef = (1 + kappa_baseline) ./ (1 + kappa_baseline - 2*sqrt(kappa_baseline)*rho_range);
     
     % Sensitivity indices
     param_results.kappa_sensitivity = calculate_sensitivity_index_simple(param_results.kappa_sef);
@@ -302,19 +286,12 @@ function validation_results = perform_statistical_validation_simple(data)
     
     % Bootstrap test for SEF > 1
     n_bootstrap = 1000;
-    sef_bootstrap = zeros(n_bootstrap, 1);
     
     team_a_perf = data.matches.team_a_performance;
     team_b_perf = data.matches.team_b_performance;
     n_total = length(team_a_perf);
     
-    for i = 1:n_bootstrap
-        % Bootstrap sample
-        sample_indices = randsample(n_total, n_total, true);
-        sample_a = team_a_perf(sample_indices);
-        sample_b = team_b_perf(sample_indices);
-        sef_bootstrap(i) = calculate_sef_simple(sample_a, sample_b);
-    end
+    sef_bootstrap = bootstrap_sef_simple(team_a_perf, team_b_perf, n_total, n_bootstrap);
     
     % Calculate p-value for SEF > 1
     validation_results.significance = struct();
@@ -358,6 +335,43 @@ function sef_value = calculate_sef_simple(team_a, team_b)
     end
 end
 
+function sef_values = bootstrap_sef_simple(team_a, team_b, n_samples, n_bootstrap)
+    % Bootstrap SEF distribution, resampled in column batches
+    
+    MAX_BATCH_ELEMENTS = 1e6;
+    batch_size = max(1, floor(MAX_BATCH_ELEMENTS / n_samples));
+    
+    team_a = team_a(:);
+    team_b = team_b(:);
+    n_total = length(team_a);
+    
+    sef_values = zeros(n_bootstrap, 1);
+    for batch_start = 1:batch_size:n_bootstrap
+        batch_cols = batch_start:min(batch_start + batch_size - 1, n_bootstrap);
+        sample_indices = randi(n_total, n_samples, length(batch_cols));
+        sef_values(batch_cols) = calculate_sef_columns_simple(team_a(sample_indices), team_b(sample_indices));
+    end
+end
+
+function sef_values = calculate_sef_columns_simple(team_a, team_b)
+    % Column-wise equivalent of calculate_sef_simple (one SEF per column)
+    
+    % Centre each column
+    centred_a = team_a - mean(team_a, 1);
+    centred_b = team_b - mean(team_b, 1);
+    ss_a = sum(centred_a.^2, 1);
+    ss_b = sum(centred_b.^2, 1);
+    
+    % Calculate Pearson correlation per column
+    rho = sum(centred_a .* centred_b, 1) ./ sqrt(ss_a .* ss_b);
+    
+    % Calculate κ and SEF (the n-1 normalisation cancels in the ratio)
+    kappa = ss_b ./ ss_a;
+    sef_values = (1 + kappa) ./ (1 + kappa - 2*sqrt(kappa).*rho);
+    sef_values(~(ss_a > 0 & ss_b > 0) | isnan(rho)) = NaN;
+    sef_values = sef_values(:);
+end
+
 function trend = calculate_temporal_trend_simple(seasonal_sef)
     % Calculate temporal trend in seasonal SEF values
     
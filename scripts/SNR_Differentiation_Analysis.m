@@ -154,10 +154,20 @@ fprintf('  • Relative measures become worse than absolute measures\n\n');
 %% Step 5: Empirical Validation
 fprintf('\nSTEP 5: Empirical validation with rugby data...\n');
 
-% Load rugby data
+% Technical KPIs to analyze
+technical_kpis = {'Carry', 'MetresMade', 'DefenderBeaten', 'Offload', 'Pass'};
+
+% Load rugby data (only the KPI and outcome columns used below)
 try
-    isolated_data = readtable('data/raw/S20Isolated.csv');
-    relative_data = readtable('data/raw/S20Relative.csv');
+    analysis_columns = [technical_kpis, {'Match_Outcome'}];
+    
+    isolated_opts = detectImportOptions('data/raw/S20Isolated.csv');
+    isolated_opts.SelectedVariableNames = analysis_columns;
+    isolated_data = readtable('data/raw/S20Isolated.csv', isolated_opts);
+    
+    relative_opts = detectImportOptions('data/raw/S20Relative.csv');
+    relative_opts.SelectedVariableNames = analysis_columns;
+    relative_data = readtable('data/raw/S20Relative.csv', relative_opts);
     fprintf('✓ Rugby data loaded successfully\n');
 catch ME
     fprintf('⚠ Could not load rugby data: %s\n', ME.message);
@@ -169,9 +179,6 @@ if ~isempty(isolated_data) && ~isempty(relative_data)
     fprintf('\nEmpirical Analysis:\n');
     fprintf('==================\n');
     
-    % Technical KPIs to analyze
-    technical_kpis = {'Carry', 'MetresMade', 'DefenderBeaten', 'Offload', 'Pass'};
-    
     fprintf('KPI\t\t\tσ_A\t\tσ_B\t\tr=σ_B/σ_A\tSNR_R/SNR_A\tTheoretical\n');
     fprintf('---\t\t\t---\t\t---\t\t---------\t----------\t----------\n');
     
@@ -183,26 +190,29 @@ if ~isempty(isolated_data) && ~isempty(relative_data)
     empirical_results.empirical_improvement = [];
     empirical_results.theoretical_improvement = [];
     
+    % Outcome masks are the same for every KPI, so compare the outcome
+    % strings once here rather than inside the KPI loop
+    abs_has_outcome = ~ismissing(isolated_data.Match_Outcome);
+    rel_has_outcome = ~ismissing(relative_data.Match_Outcome);
+    abs_is_win = strcmp(isolated_data.Match_Outcome, 'W');
+    rel_is_win = strcmp(relative_data.Match_Outcome, 'W');
+    
     for i = 1:length(technical_kpis)
         kpi = technical_kpis{i};
         
         % Get data
         abs_data = isolated_data.(kpi);
         rel_data = relative_data.(kpi);
-        abs_outcomes = isolated_data.Match_Outcome;
-        rel_outcomes = relative_data.Match_Outcome;
         
         % Clean data
-        valid_abs = ~isnan(abs_data) & ~ismissing(abs_outcomes);
-        valid_rel = ~isnan(rel_data) & ~ismissing(rel_outcomes);
+        valid_abs = ~isnan(abs_data) & abs_has_outcome;
+        valid_rel = ~isnan(rel_data) & rel_has_outcome;
         
         abs_data = abs_data(valid_abs);
-        abs_outcomes = abs_outcomes(valid_abs);
         rel_data = rel_data(valid_rel);
-        rel_outcomes = rel_outcomes(valid_rel);
         
-        wins_abs = strcmp(abs_outcomes, 'W');
-        wins_rel = strcmp(rel_outcomes, 'W');
+        wins_abs = abs_is_win(valid_abs);
+        wins_rel = rel_is_win(valid_rel);
         
         if sum(wins_abs) > 2 && sum(wins_rel) > 2
             % Calculate standard deviations
@@ -43,24 +43,12 @@ fprintf('  Grid size: %d × %d = %d points\n', length(kappa_range), length(rho_r
 fprintf('\nSTEP 2: Calculating SNR improvement surface...\n');
 fprintf('===========================================\n');
 
-% Calculate SNR improvement for each point
-SNR_IMPROVEMENT = zeros(size(KAPPA));
-
-for i = 1:size(KAPPA, 1)
-    for j = 1:size(KAPPA, 2)
-        kappa = KAPPA(i, j);
-        rho = RHO(i, j);
-        
-        % SNR improvement formula
-        denominator = 1 + kappa - 2*sqrt(kappa)*rho;
-        
-        if abs(denominator) > 1e-10 % Avoid division by zero
-            SNR_IMPROVEMENT(i, j) = (1 + kappa) / denominator;
-        else
-            SNR_IMPROVEMENT(i, j) = Inf; % Mark critical points
-        end
-    end
-end
+% Calculate SNR improvement over the whole grid, broadcasting the 1-D
+% κ row against the ρ column instead of looping point by point
+denominator = 1 + kappa_range - 2*sqrt(kappa_range).*rho_range(:);
+
+SNR_IMPROVEMENT = (1 + kappa_range) ./ denominator;
+SNR_IMPROVEMENT(abs(denominator) <= 1e-10) = Inf; % Mark critical points
 
 % Handle infinite values for visualization
 SNR_IMPROVEMENT_CLIPPED = SNR_IMPROVEMENT;
@@ -248,13 +236,7 @@ subplot(3,4,12);
 disciplines = {'Sports', 'Finance', 'Medicine', 'Engineering'};
 kappa_examples = [1.5, 0.8, 2.2, 0.6];
 rho_examples = [0.3, 0.1, 0.4, 0.2];
-snr_examples = zeros(size(kappa_examples));
-
-for i = 1:length(disciplines)
-    kappa = kappa_examples(i);
-    rho = rho_examples(i);
-    snr_examples(i) = (1 + kappa) / (1 + kappa - 2*sqrt(kappa)*rho);
-end
+snr_examples = (1 + kappa_examples) ./ (1 + kappa_examples - 2*sqrt(kappa_examples).*rho_examples);
 
 bar(snr_examples);
 set(gca, 'XTickLabel', disciplines, 'XTickLabelRotation', 45);
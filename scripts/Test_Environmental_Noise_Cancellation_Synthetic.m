@@ -53,12 +53,13 @@ end
 function [X_A, X_B, R, Y] = generateSyntheticData(n, mu_A, mu_B, sigma_A, sigma_B, sigma_eta, upset_prob)
     %GENERATESYNTHETICDATA Generate synthetic data matching theoretical model
     
-    % Generate individual variations
-    eps_A = sigma_A * randn(n, 1);
-    eps_B = sigma_B * randn(n, 1);
-    
-    % Generate shared environmental noise
-    eta = sigma_eta * randn(n, 1);
+    % Generate individual variations and shared environmental noise in one
+    % draw (columns ε_A, ε_B, η); column-major fill keeps the same sequence
+    % as three separate randn(n, 1) calls
+    noise = randn(n, 3) .* [sigma_A, sigma_B, sigma_eta];
+    eps_A = noise(:, 1);
+    eps_B = noise(:, 2);
+    eta = noise(:, 3);
     
     % Generate absolute measures (with environmental noise)
     X_A = mu_A + eps_A + eta;
@@ -249,9 +250,11 @@ function generateVisualizations(X_A, X_B, R, Y, theory_results)
     
     % Plot 1: Data distributions
     subplot(2, 3, 1);
-    histogram(X_A, 30, 'Normalization', 'probability', 'FaceAlpha', 0.3);
+    % Bin edges computed once and shared so the overlaid histograms line up
+    [~, shared_edges] = histcounts([X_A(:); X_B(:)], 30);
+    histogram(X_A, shared_edges, 'Normalization', 'probability', 'FaceAlpha', 0.3);
     hold on;
-    histogram(X_B, 30, 'Normalization', 'probability', 'FaceAlpha', 0.3);
+    histogram(X_B, shared_edges, 'Normalization', 'probability', 'FaceAlpha', 0.3);
     xlabel('Absolute Measures');
     ylabel('Probability');
     title('Absolute Measures (with Environmental Noise)');
@@ -74,16 +74,13 @@ for i = 1:length(required_cols)
 end
 
 % Check match structure
-unique_matches = unique(isolated_data.Match_x);
+[unique_matches, ~, match_group] = unique(isolated_data.Match_x);
 fprintf('✓ Unique matches: %d\n', length(unique_matches));
 
-% Validate 2-team structure
-match_team_counts = [];
-for i = 1:min(10, length(unique_matches))
-    match_id = unique_matches(i);
-    match_data = isolated_data(strcmp(isolated_data.Match_x, match_id), :);
-    match_team_counts(end+1) = height(match_data);
-end
+% Validate 2-team structure: rows per match from the group indices,
+% rather than scanning Match_x once per match
+match_team_counts = accumarray(match_group, 1)';
+match_team_counts = match_team_counts(1:min(10, length(unique_matches)));
 
 fprintf('✓ Match team counts (first 10): %s\n', mat2str(match_team_counts));
 if all(match_team_counts == 2)
@@ -155,6 +152,21 @@ sigma_validation_results.sigma_B = [];
 sigma_validation_results.variance_ratio = [];
 sigma_validation_results.estimation_valid = [];
 
+% Row pairs (Team A, Team B) of the first 20 two-team matches, used for every KPI's sigma check
+n_paired_matches = min(20, length(unique_matches));
+paired_rows = zeros(n_paired_matches, 2);
+is_paired = false(n_paired_matches, 1);
+
+for j = 1:n_paired_matches
+    match_rows = find(match_group == j);
+    
+    if length(match_rows) == 2
+        paired_rows(j, :) = match_rows';
+        is_paired(j) = true;
+    end
+end
+paired_rows = paired_rows(is_paired, :);
+
 for i = 1:length(technical_kpis)
     kpi = technical_kpis{i};
     
@@ -162,18 +174,9 @@ for i = 1:length(technical_kpis)
         fprintf('\nValidating %s:\n', kpi);
         
         % Collect team A and B data
-        team_A_data = [];
-        team_B_data = [];
-        
-        for j = 1:min(20, length(unique_matches))
-            match_id = unique_matches(j);
-            match_data = isolated_data(strcmp(isolated_data.Match_x, match_id), :);
-            
-            if height(match_data) == 2
-                team_A_data(end+1) = match_data.(kpi)(1);
-                team_B_data(end+1) = match_data.(kpi)(2);
-            end
-        end
+        kpi_values = isolated_data.(kpi);
+        team_A_data = kpi_values(paired_rows(:, 1))';
+        team_B_data = kpi_values(paired_rows(:, 2))';
         
         % Validate data collection
         if length(team_A_data) > 5 && length(team_B_data) > 5
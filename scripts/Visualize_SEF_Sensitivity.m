@@ -120,6 +120,7 @@ function visualize_sample_size_sensitivity(sample_results)
     % Save figure
     saveas(gcf, 'outputs/figures/sensitivity_analysis/sample_size_sensitivity.png');
     saveas(gcf, 'outputs/figures/sensitivity_analysis/sample_size_sensitivity.fig');
+    close(gcf);
     
     fprintf('    ✓ Sample size sensitivity plots saved\n');
 end
@@ -189,6 +190,7 @@ function visualize_temporal_behavior(temporal_results)
     % Save figure
     saveas(gcf, 'outputs/figures/sensitivity_analysis/temporal_behavior.png');
     saveas(gcf, 'outputs/figures/sensitivity_analysis/temporal_behavior.fig');
+    close(gcf);
     
     fprintf('    ✓ Temporal behavior plots saved\n');
 end
@@ -268,6 +270,7 @@ function visualize_parameter_sensitivity(param_results)
     % Save figure
     saveas(gcf, 'outputs/figures/sensitivity_analysis/parameter_sensitivity.png');
     saveas(gcf, 'outputs/figures/sensitivity_analysis/parameter_sensitivity.fig');
+    close(gcf);
     
     fprintf('    ✓ Parameter sensitivity plots saved\n');
 end
@@ -334,6 +337,7 @@ function visualize_robustness_analysis(robustness_results)
     % Save figure
     saveas(gcf, 'outputs/figures/sensitivity_analysis/robustness_analysis.png');
     saveas(gcf, 'outputs/figures/sensitivity_analysis/robustness_analysis.fig');
+    close(gcf);
     
     fprintf('    ✓ Robustness analysis plots saved\n');
 end
@@ -403,6 +407,7 @@ function visualize_statistical_validation(validation_results)
     % Save figure
     saveas(gcf, 'outputs/figures/sensitivity_analysis/statistical_validation.png');
     saveas(gcf, 'outputs/figures/sensitivity_analysis/statistical_validation.fig');
+    close(gcf);
     
     fprintf('    ✓ Statistical validation plots saved\n');
 end
@@ -538,6 +543,7 @@ function create_comprehensive_summary(results)
     % Save figure
     saveas(gcf, 'outputs/figures/sensitivity_analysis/comprehensive_summary.png');
     saveas(gcf, 'outputs/figures/sensitivity_analysis/comprehensive_summary.fig');
+    close(gcf);
     
     fprintf('    ✓ Comprehensive summary saved\n');
 end
@@ -8,10 +8,11 @@ CMS data catalog we found earlier: https://data.cms.gov/data.json
 
 import requests
 import json
-import pandas as pd
 import time
 from datetime import datetime
 
+session = requests.Session()
+
 def access_cms_data_catalog():
     """
     Access the CMS data catalog to find actual data sources
@@ -24,7 +25,7 @@ def access_cms_data_catalog():
     
     try:
         print(f"Fetching catalog: {catalog_url}")
-        response = requests.get(catalog_url, timeout=10)
+        response = session.get(catalog_url, timeout=10)
         
         if response.status_code == 200:
             try:
@@ -118,7 +119,7 @@ def test_hospital_data_downloads(hospital_datasets):
                     
                     try:
                         # Test with HEAD request first
-                        response = requests.head(url, timeout=10)
+                        response = session.head(url, timeout=10)
                         print(f"     Status: {response.status_code}")
                         
                         if response.status_code == 200:
@@ -134,7 +135,7 @@ def test_hospital_data_downloads(hospital_datasets):
                             if 'csv' in content_type.lower():
                                 print(f"     📊 CSV data - testing sample download...")
                                 try:
-                                    sample_response = requests.get(url, timeout=10, stream=True)
+                                    sample_response = session.get(url, timeout=10, stream=True)
                                     if sample_response.status_code == 200:
                                         # Read first few lines
                                         lines = []
@@ -192,7 +193,7 @@ def search_for_specific_hospitals():
     for url in search_urls:
         print(f"\n🔍 Searching: {url}")
         try:
-            response = requests.get(url, timeout=10)
+            response = session.get(url, timeout=10)
             
             if response.status_code == 200:
                 html_content = response.text
@@ -206,11 +207,12 @@ def search_for_specific_hospitals():
                         print(f"  ❌ {hospital_name} (ID: {provider_id}) not found in content")
                 
                 # Look for download or data access patterns
-                if 'download' in html_content.lower():
+                page_text = html_content.lower()
+                if 'download' in page_text:
                     print(f"  📥 Download references found")
-                if 'csv' in html_content.lower():
+                if 'csv' in page_text:
                     print(f"  📊 CSV references found")
-                if 'api' in html_content.lower():
+                if 'api' in page_text:
                     print(f"  🔌 API references found")
                     
             else:
@@ -11,6 +11,8 @@ import json
 import time
 from datetime import datetime
 
+session = requests.Session()
+
 def analyze_cms_data_catalog():
     """
     Analyze the CMS data catalog to understand available datasets
@@ -23,7 +25,7 @@ def analyze_cms_data_catalog():
     
     try:
         print(f"Fetching CMS data catalog: {catalog_url}")
-        response = requests.get(catalog_url, timeout=10)
+        response = session.get(catalog_url, timeout=10)
         
         if response.status_code == 200:
             try:
@@ -151,7 +153,7 @@ def test_download_urls(hospital_datasets):
                     
                     try:
                         # Test with HEAD request to avoid downloading large files
-                        response = requests.head(url, timeout=10)
+                        response = session.head(url, timeout=10)
                         print(f"  Status: {response.status_code}")
                         
                         if response.status_code == 200:
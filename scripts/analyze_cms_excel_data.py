@@ -13,13 +13,15 @@ import os
 import time
 from datetime import datetime
 
+session = requests.Session()
+
 def download_and_analyze_cms_excel(url, filename):
     """
     Download a CMS ZIP file and analyze the Excel files inside
     """
     print(f"Downloading: {url}")
     try:
-        response = requests.get(url, timeout=30)
+        response = session.get(url, timeout=30)
         
         if response.status_code == 200:
             print(f"✅ Download successful: {len(response.content)} bytes")
@@ -176,7 +178,7 @@ def search_for_quality_measures():
         print(f"   URL: {dataset['url']}")
         
         try:
-            response = requests.get(dataset['url'], timeout=10)
+            response = session.get(dataset['url'], timeout=10)
             print(f"   Status: {response.status_code}")
             
             if response.status_code == 200:
@@ -184,13 +186,14 @@ def search_for_quality_measures():
                 print(f"   ✅ Accessible: {len(html_content)} characters")
                 
                 # Look for download links or data access information
-                if 'download' in html_content.lower():
+                page_text = html_content.lower()
+                if 'download' in page_text:
                     print(f"   📥 Download references found")
-                if 'csv' in html_content.lower():
+                if 'csv' in page_text:
                     print(f"   📊 CSV references found")
-                if 'excel' in html_content.lower():
+                if 'excel' in page_text:
                     print(f"   📊 Excel references found")
-                if 'api' in html_content.lower():
+                if 'api' in page_text:
                     print(f"   🔌 API references found")
             else:
                 print(f"   ❌ Not accessible: {response.status_code}")
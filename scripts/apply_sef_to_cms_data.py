@@ -6,8 +6,6 @@ Focus on Mayo Clinic vs Cleveland Clinic comparison using HAC measures
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from scipy import stats
 from scipy.stats import shapiro, kstest, normaltest
 import warnings
@@ -19,7 +17,9 @@ def load_cms_data():
     print("=" * 60)
     
     try:
-        df = pd.read_csv('data/raw/cms_hac_measures_2025.csv')
+        # Only the provider, measure and rate columns are used downstream
+        df = pd.read_csv('data/raw/cms_hac_measures_2025.csv',
+                         usecols=['Provider_ID', 'Measure', 'Rate'])
         print(f"✅ Data loaded successfully:")
         print(f"   Rows: {len(df)}")
         print(f"   Columns: {list(df.columns)}")
@@ -28,8 +28,12 @@ def load_cms_data():
         mayo_id = 240001
         cleveland_id = 360001
         
-        mayo_data = df[df['Provider_ID'] == mayo_id].copy()
-        cleveland_data = df[df['Provider_ID'] == cleveland_id].copy()
+        # Split both hospitals out in a single groupby pass instead of
+        # scanning the full table once per provider
+        hospitals = dict(tuple(df[df['Provider_ID'].isin([mayo_id, cleveland_id])]
+                               .groupby('Provider_ID', sort=False)))
+        mayo_data = hospitals.get(mayo_id, df.iloc[0:0]).copy()
+        cleveland_data = hospitals.get(cleveland_id, df.iloc[0:0]).copy()
         
         print(f"\n🏥 Hospital Data:")
         print(f"   Mayo Clinic (ID: {mayo_id}): {len(mayo_data)} records")
@@ -57,22 +61,27 @@ def analyze_hospital_measures(mayo_data, cleveland_data):
     print(f"   Common measures: {len(common_measures)}")
     print(f"   Common measure names: {list(common_measures)}")
     
-    # Create comparison dataframe
-    comparison_data = []
-    
-    for measure in common_measures:
-        mayo_rate = mayo_data[mayo_data['Measure'] == measure]['Rate'].iloc[0]
-        cleveland_rate = cleveland_data[cleveland_data['Measure'] == measure]['Rate'].iloc[0]
-        
-        comparison_data.append({
-            'Measure': measure,
-            'Mayo_Rate': mayo_rate,
-            'Cleveland_Rate': cleveland_rate,
-            'Difference': mayo_rate - cleveland_rate,
-            'Relative_Difference': (mayo_rate - cleveland_rate) / cleveland_rate if cleveland_rate != 0 else np.nan
-        })
-    
-    comparison_df = pd.DataFrame(comparison_data)
+    # Index each hospital's first rate by measure once, rather than
+    # re-comparing the Measure strings for every common measure
+    mayo_rate_by_measure = mayo_data.drop_duplicates('Measure').set_index('Measure')['Rate']
+    cleveland_rate_by_measure = cleveland_data.drop_duplicates('Measure').set_index('Measure')['Rate']
+    
+    # Create comparison dataframe column-by-column from the aligned rates
+    measures = list(common_measures)
+    mayo_rates = mayo_rate_by_measure.loc[measures].to_numpy(dtype=float)
+    cleveland_rates = cleveland_rate_by_measure.loc[measures].to_numpy(dtype=float)
+    differences = mayo_rates - cleveland_rates
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative_differences = np.where(cleveland_rates != 0, differences / cleveland_rates, np.nan)
+    
+    comparison_df = pd.DataFrame({
+        'Measure': measures,
+        'Mayo_Rate': mayo_rates,
+        'Cleveland_Rate': cleveland_rates,
+        'Difference': differences,
+        'Relative_Difference': relative_differences
+    })
     print(f"\n📊 Comparison Summary:")
     print(comparison_df)
     
@@ -243,6 +252,10 @@ def main():
     # Analyze measures
     comparison_df = analyze_hospital_measures(mayo_data, cleveland_data)
     
+    # Split each hospital's rates by measure once for the per-measure analysis
+    mayo_rates = dict(tuple(mayo_data.groupby('Measure', sort=False)['Rate']))
+    cleveland_rates = dict(tuple(cleveland_data.groupby('Measure', sort=False)['Rate']))
+    
     # Apply SEF framework to each measure
     sef_results = []
     
@@ -253,8 +266,8 @@ def main():
         print(f"{'='*60}")
         
         # Get data for this measure
-        mayo_measure_data = mayo_data[mayo_data['Measure'] == measure]['Rate']
-        cleveland_measure_data = cleveland_data[cleveland_data['Measure'] == measure]['Rate']
+        mayo_measure_data = mayo_rates[measure]
+        cleveland_measure_data = cleveland_rates[measure]
         
         # Calculate SEF parameters
         params = calculate_sef_parameters(mayo_measure_data, cleveland_measure_data, measure)
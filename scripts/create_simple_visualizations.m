@@ -185,11 +185,9 @@ title('Overall Performance Improvement', 'FontSize', 16, 'FontWeight', 'bold');
 grid on;
 
 % Add value labels on bars
-for i = 1:3
-    text(i, overall_improvements(i) + overall_stds(i) + 0.5, ...
-         sprintf('%.1f%%', overall_improvements(i)), ...
-         'HorizontalAlignment', 'center', 'FontWeight', 'bold');
-end
+text((1:3)', overall_improvements(:) + overall_stds(:) + 0.5, ...
+     compose('%.1f%%', overall_improvements(:)), ...
+     'HorizontalAlignment', 'center', 'FontWeight', 'bold');
 
 sgtitle('Figure 2: Performance Improvement Across Metrics', 'FontSize', 18, 'FontWeight', 'bold');
 
@@ -219,11 +217,9 @@ ylabel('Improvement (%)');
 title('Average Performance Improvement', 'FontSize', 14, 'FontWeight', 'bold');
 grid on;
 
-% Add value labels
-for i = 1:3
-    text(i, overall_improvements(i) + 0.5, sprintf('%.1f%%', overall_improvements(i)), ...
-         'HorizontalAlignment', 'center', 'FontWeight', 'bold');
-end
+% Add value labels (one text call for all bars)
+text((1:3)', overall_improvements(:) + 0.5, compose('%.1f%%', overall_improvements(:)), ...
+     'HorizontalAlignment', 'center', 'FontWeight', 'bold');
 
 % Subplot 3: Top 10 performing metrics
 subplot(2, 2, 3);
@@ -273,16 +269,10 @@ ylabel('Standard Deviation');
 title('Environmental vs Individual Noise Components', 'FontSize', 16, 'FontWeight', 'bold');
 grid on;
 
-% Add value labels
-for i = 1:2
-    if i == 1
-        value = sigma_eta;
-    else
-        value = sigma_indiv;
-    end
-    text(i, value + 1, sprintf('%.3f', value), ...
-         'HorizontalAlignment', 'center', 'FontWeight', 'bold');
-end
+% Add value labels (one text call for both bars)
+noise_components = [sigma_eta; sigma_indiv];
+text((1:2)', noise_components + 1, compose('%.3f', noise_components), ...
+     'HorizontalAlignment', 'center', 'FontWeight', 'bold');
 
 fig_file = fullfile(figures_dir, 'publication_figure1_noise_components.png');
 saveas(gcf, fig_file, 'png');
@@ -79,10 +79,8 @@ title('Theoretical vs Empirical SNR Improvement', 'FontSize', 16, 'FontWeight',
 grid on;
 
 % Add value labels
-for i = 1:2
-    text(i, comparison_data(i) + 2, sprintf('%.1f%%', comparison_data(i)), ...
-         'HorizontalAlignment', 'center', 'FontWeight', 'bold');
-end
+text((1:2)', comparison_data(:) + 2, compose('%.1f%%', comparison_data(:)), ...
+     'HorizontalAlignment', 'center', 'FontWeight', 'bold');
 
 % Subplot 2: SNR improvement distribution across metrics
 subplot(2, 3, 2);
@@ -153,8 +151,9 @@ text(0.1, 0.6, sprintf('Environmental Ratio: %.1f%%', env_ratio*100), 'FontSize'
 text(0.1, 0.5, sprintf('Metrics Analyzed: %d', n_metrics), 'FontSize', 12);
 text(0.1, 0.4, sprintf('Sample Size: %d matches', comprehensive_results.rugby_analysis.feature_info.n_samples), 'FontSize', 12);
 
-% Calculate validation success
-if abs(theoretical_snr_percent - overall_empirical_snr_percent) < 20 % Within 20% threshold
+% Calculate validation success (prediction error computed once and reused)
+prediction_error_percent = abs(theoretical_snr_percent - overall_empirical_snr_percent);
+if prediction_error_percent < 20 % Within 20% threshold
     validation_status = 'VALIDATED';
     status_color = [0.4660, 0.6740, 0.1880];
 else
@@ -163,7 +162,7 @@ else
 end
 
 text(0.1, 0.3, sprintf('Validation Status: %s', validation_status), 'FontSize', 12, 'FontWeight', 'bold', 'Color', status_color);
-text(0.1, 0.2, sprintf('Difference: %.1f%%', abs(theoretical_snr_percent - overall_empirical_snr_percent)), 'FontSize', 12);
+text(0.1, 0.2, sprintf('Difference: %.1f%%', prediction_error_percent), 'FontSize', 12);
 axis off;
 
 sgtitle('Figure 1: SNR Improvement: Theory vs Empirical Validation', 'FontSize', 18, 'FontWeight', 'bold');
@@ -232,8 +231,9 @@ text(0.1*max_val, 0.9*max_val, sprintf('Correlation: %.3f', correlation(1,2)), .
 % Subplot 4: SNR improvement by metric category
 subplot(2, 2, 4);
 % Group metrics by performance level
-high_improvement = empirical_snr_percent >= mean(empirical_snr_percent);
-low_improvement = empirical_snr_percent < mean(empirical_snr_percent);
+mean_empirical_snr_percent = mean(empirical_snr_percent);
+high_improvement = empirical_snr_percent >= mean_empirical_snr_percent;
+low_improvement = empirical_snr_percent < mean_empirical_snr_percent;
 
 performance_groups = {'High Improvement', 'Low Improvement'};
 group_means = [mean(empirical_snr_percent(high_improvement)), mean(empirical_snr_percent(low_improvement))];
@@ -248,10 +248,8 @@ title('SNR Improvement by Performance Group', 'FontSize', 16, 'FontWeight', 'bol
 grid on;
 
 % Add value labels
-for i = 1:2
-    text(i, group_means(i) + group_stds(i) + 1, sprintf('%.1f%%', group_means(i)), ...
-         'HorizontalAlignment', 'center', 'FontWeight', 'bold');
-end
+text((1:2)', group_means(:) + group_stds(:) + 1, compose('%.1f%%', group_means(:)), ...
+     'HorizontalAlignment', 'center', 'FontWeight', 'bold');
 
 sgtitle('Figure 2: SNR Theory Validation and Analysis', 'FontSize', 18, 'FontWeight', 'bold');
 
@@ -276,10 +274,8 @@ title('SNR Improvement: Theory vs Empirical', 'FontSize', 16, 'FontWeight', 'bol
 grid on;
 
 % Add value labels
-for i = 1:2
-    text(i, comparison_data(i) + 2, sprintf('%.1f%%', comparison_data(i)), ...
-         'HorizontalAlignment', 'center', 'FontWeight', 'bold');
-end
+text((1:2)', comparison_data(:) + 2, compose('%.1f%%', comparison_data(:)), ...
+     'HorizontalAlignment', 'center', 'FontWeight', 'bold');
 
 % Environmental noise relationship
 subplot(2, 2, 2);
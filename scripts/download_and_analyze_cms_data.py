@@ -14,20 +14,37 @@ import os
 import time
 from datetime import datetime
 
+session = requests.Session()
+
+# ZIP payloads already fetched during this run, keyed by URL; the 2021
+# inpatient file is requested by several of the analysis steps below
+downloaded_content = {}
+
+def fetch_zip_content(url):
+    """
+    Fetch a ZIP payload, reusing it if this run already downloaded it
+    """
+    if url not in downloaded_content:
+        response = session.get(url, timeout=30)
+        if response.status_code != 200:
+            return response.status_code, None
+        downloaded_content[url] = response.content
+    return 200, downloaded_content[url]
+
 def download_cms_zip_file(url, filename):
     """
     Download a CMS ZIP file and extract its contents
     """
     print(f"Downloading: {url}")
     try:
-        response = requests.get(url, timeout=30)
+        status_code, content = fetch_zip_content(url)
         
-        if response.status_code == 200:
-            print(f"✅ Download successful: {len(response.content)} bytes")
+        if status_code == 200:
+            print(f"✅ Download successful: {len(content)} bytes")
             
             # Save the ZIP file
             with open(filename, 'wb') as f:
-                f.write(response.content)
+                f.write(content)
             
             print(f"📁 Saved to: {filename}")
             
@@ -71,7 +88,7 @@ def download_cms_zip_file(url, filename):
             return True
             
         else:
-            print(f"❌ Download failed: {response.status_code}")
+            print(f"❌ Download failed: {status_code}")
             return False
             
     except Exception as e:
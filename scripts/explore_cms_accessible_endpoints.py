@@ -9,13 +9,15 @@ import json
 from bs4 import BeautifulSoup
 import time
 
+session = requests.Session()
+
 def test_endpoint_content(url, description):
     """Test what content is actually available at accessible endpoints"""
     print(f"\n🔍 Testing: {description}")
     print(f"URL: {url}")
     
     try:
-        response = requests.get(url, timeout=10)
+        response = session.get(url, timeout=10)
         print(f"Status: {response.status_code}")
         print(f"Content-Type: {response.headers.get('content-type', 'Unknown')}")
         print(f"Content-Length: {len(response.content)} bytes")
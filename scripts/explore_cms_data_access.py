@@ -17,6 +17,8 @@ import time
 from datetime import datetime
 import os
 
+session = requests.Session()
+
 def explore_cms_data_portal():
     """
     Explore the CMS data portal to understand available datasets
@@ -38,7 +40,7 @@ def explore_cms_data_portal():
     for name, url in cms_urls.items():
         print(f"\n{name.upper()}: {url}")
         try:
-            response = requests.get(url, timeout=10)
+            response = session.get(url, timeout=10)
             print(f"  Status: {response.status_code}")
             
             if response.status_code == 200:
@@ -76,7 +78,7 @@ def explore_cms_api_structure():
     
     try:
         print(f"Testing API base: {api_base}")
-        response = requests.get(api_base, timeout=10)
+        response = session.get(api_base, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -136,7 +138,7 @@ def explore_specific_dataset(dataset_id):
     for endpoint in endpoints:
         print(f"\nTesting: {endpoint}")
         try:
-            response = requests.get(endpoint, timeout=10)
+            response = session.get(endpoint, timeout=10)
             print(f"  Status: {response.status_code}")
             
             if response.status_code == 200:
@@ -182,7 +184,7 @@ def check_data_access_requirements():
     
     # Test without authentication
     try:
-        response = requests.get(test_url, timeout=10)
+        response = session.get(test_url, timeout=10)
         print(f"Without authentication: {response.status_code}")
         
         if response.status_code == 200:
@@ -202,7 +204,7 @@ def check_data_access_requirements():
     try:
         responses = []
         for i in range(3):
-            response = requests.get(test_url, timeout=5)
+            response = session.get(test_url, timeout=5)
             responses.append(response.status_code)
             time.sleep(0.5)
         
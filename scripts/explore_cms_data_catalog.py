@@ -8,6 +8,8 @@ import requests
 import json
 import time
 
+session = requests.Session()
+
 def explore_data_catalog():
     """Explore the main CMS data catalog"""
     print("🔍 Exploring CMS Data Catalog")
@@ -16,7 +18,7 @@ def explore_data_catalog():
     url = "https://data.cms.gov/data.json"
     
     try:
-        response = requests.get(url, timeout=10)
+        response = session.get(url, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -66,7 +68,7 @@ def explore_provider_data_api():
     url = "https://data.cms.gov/provider-data/api"
     
     try:
-        response = requests.get(url, timeout=10)
+        response = session.get(url, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -79,7 +81,7 @@ def explore_provider_data_api():
             if api_url:
                 print(f"\n🔗 Testing API URL: {api_url}")
                 try:
-                    api_response = requests.get(api_url, timeout=10)
+                    api_response = session.get(api_url, timeout=10)
                     print(f"API Status: {api_response.status_code}")
                     print(f"API Content-Type: {api_response.headers.get('content-type', 'Unknown')}")
                     
@@ -115,7 +117,7 @@ def test_hospital_specific_endpoints():
     
     for url in test_patterns:
         try:
-            response = requests.get(url, timeout=10)
+            response = session.get(url, timeout=10)
             print(f"\n🔗 {url}")
             print(f"   Status: {response.status_code}")
             
@@ -10,6 +10,8 @@ import time
 import pandas as pd
 from datetime import datetime, timedelta
 
+session = requests.Session()
+
 def explore_github_trending_repos():
     """Explore GitHub trending repositories for performance data"""
     print("🔍 Exploring GitHub Trending Repositories")
@@ -25,7 +27,7 @@ def explore_github_trending_repos():
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = session.get(url, params=params, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -33,27 +35,26 @@ def explore_github_trending_repos():
             repos = data.get('items', [])
             print(f"📊 Found {len(repos)} trending repositories")
             
-            # Extract performance metrics
-            repo_metrics = []
-            for repo in repos[:20]:  # Analyze top 20
-                metrics = {
-                    'name': repo.get('name', ''),
-                    'full_name': repo.get('full_name', ''),
-                    'stars': repo.get('stargazers_count', 0),
-                    'forks': repo.get('forks_count', 0),
-                    'watchers': repo.get('watchers_count', 0),
-                    'open_issues': repo.get('open_issues_count', 0),
-                    'size': repo.get('size', 0),
-                    'language': repo.get('language', ''),
-                    'created_at': repo.get('created_at', ''),
-                    'updated_at': repo.get('updated_at', ''),
-                    'pushed_at': repo.get('pushed_at', ''),
-                    'score': repo.get('score', 0)
-                }
-                repo_metrics.append(metrics)
+            # Extract performance metrics: column -> (API field, default)
+            repo_fields = {
+                'name': ('name', ''),
+                'full_name': ('full_name', ''),
+                'stars': ('stargazers_count', 0),
+                'forks': ('forks_count', 0),
+                'watchers': ('watchers_count', 0),
+                'open_issues': ('open_issues_count', 0),
+                'size': ('size', 0),
+                'language': ('language', ''),
+                'created_at': ('created_at', ''),
+                'updated_at': ('updated_at', ''),
+                'pushed_at': ('pushed_at', ''),
+                'score': ('score', 0)
+            }
+            top_repos = repos[:20]  # Analyze top 20
             
-            # Create DataFrame
-            df = pd.DataFrame(repo_metrics)
+            # Create DataFrame directly from per-column lists
+            df = pd.DataFrame({column: [repo.get(field, default) for repo in top_repos]
+                               for column, (field, default) in repo_fields.items()})
             print(f"\n📊 Repository Performance Metrics:")
             print(f"   Rows: {len(df)}")
             print(f"   Columns: {len(df.columns)}")
@@ -87,29 +88,28 @@ def explore_github_contributor_performance():
     repo_url = "https://api.github.com/repos/tensorflow/tensorflow/contributors"
     
     try:
-        response = requests.get(repo_url, timeout=10)
+        response = session.get(repo_url, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
             contributors = response.json()
             print(f"📊 Found {len(contributors)} contributors")
             
-            # Extract contributor metrics
-            contributor_metrics = []
-            for contributor in contributors[:20]:  # Analyze top 20
-                metrics = {
-                    'login': contributor.get('login', ''),
-                    'id': contributor.get('id', 0),
-                    'contributions': contributor.get('contributions', 0),
-                    'avatar_url': contributor.get('avatar_url', ''),
-                    'html_url': contributor.get('html_url', ''),
-                    'type': contributor.get('type', ''),
-                    'site_admin': contributor.get('site_admin', False)
-                }
-                contributor_metrics.append(metrics)
+            # Extract contributor metrics: column -> default
+            contributor_fields = {
+                'login': '',
+                'id': 0,
+                'contributions': 0,
+                'avatar_url': '',
+                'html_url': '',
+                'type': '',
+                'site_admin': False
+            }
+            top_contributors = contributors[:20]  # Analyze top 20
             
-            # Create DataFrame
-            df = pd.DataFrame(contributor_metrics)
+            # Create DataFrame directly from per-column lists
+            df = pd.DataFrame({field: [contributor.get(field, default) for contributor in top_contributors]
+                               for field, default in contributor_fields.items()})
             print(f"\n📊 Contributor Performance Metrics:")
             print(f"   Rows: {len(df)}")
             print(f"   Columns: {len(df.columns)}")
@@ -144,7 +144,7 @@ def explore_github_commit_performance():
     params = {'per_page': 100}
     
     try:
-        response = requests.get(repo_url, params=params, timeout=10)
+        response = session.get(repo_url, params=params, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -156,18 +156,19 @@ def explore_github_commit_performance():
             for commit in commits[:50]:  # Analyze top 50
                 commit_data = commit.get('commit', {})
                 author = commit_data.get('author', {})
+                message = commit_data.get('message', '')
                 
                 metrics = {
                     'sha': commit.get('sha', ''),
-                    'message': commit_data.get('message', ''),
+                    'message': message,
                     'author_name': author.get('name', ''),
                     'author_email': author.get('email', ''),
                     'date': author.get('date', ''),
                     'comment_count': commit.get('comment_count', 0),
                     'verification': commit.get('verification', {}).get('verified', False),
                     'html_url': commit.get('html_url', ''),
-                    'message_length': len(commit_data.get('message', '')),
-                    'is_merge': 'Merge' in commit_data.get('message', '')
+                    'message_length': len(message),
+                    'is_merge': 'Merge' in message
                 }
                 commit_metrics.append(metrics)
             
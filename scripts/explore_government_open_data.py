@@ -10,6 +10,8 @@ import time
 import pandas as pd
 from io import StringIO
 
+session = requests.Session()
+
 def explore_data_gov_uk():
     """Explore UK Government Open Data portal"""
     print("🔍 Exploring UK Government Open Data")
@@ -19,7 +21,7 @@ def explore_data_gov_uk():
     url = "https://data.gov.uk/api/3/action/package_list"
     
     try:
-        response = requests.get(url, timeout=10)
+        response = session.get(url, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -59,7 +61,7 @@ def explore_specific_dataset(dataset_name):
     params = {'id': dataset_name}
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = session.get(url, params=params, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -103,7 +105,7 @@ def download_csv_data(dataset_name, resource):
         return None
     
     try:
-        response = requests.get(url, timeout=30)
+        response = session.get(url, timeout=30)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -130,9 +132,10 @@ def download_csv_data(dataset_name, resource):
                     print(f"\n📊 Sample data:")
                     print(df[competitive_cols].head())
                 
-                # Save the data
+                # Save the raw downloaded bytes
                 filename = f"data/raw/gov_uk_{dataset_name.replace(' ', '_')}.csv"
-                df.to_csv(filename, index=False)
+                with open(filename, 'wb') as f:
+                    f.write(response.content)
                 print(f"💾 Data saved to: {filename}")
                 
                 return df
@@ -164,7 +167,7 @@ def explore_usa_data_gov():
     url = "https://catalog.data.gov/api/3/action/package_list"
     
     try:
-        response = requests.get(url, timeout=10)
+        response = session.get(url, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -199,7 +202,7 @@ def explore_canada_open_data():
     url = "https://open.canada.ca/data/en/api/3/action/package_list"
     
     try:
-        response = requests.get(url, timeout=10)
+        response = session.get(url, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -9,6 +9,8 @@ import json
 import time
 from bs4 import BeautifulSoup
 
+session = requests.Session()
+
 def explore_mlperf_website():
     """Explore MLPerf website for benchmark data access"""
     print("🔍 Exploring MLPerf AI Benchmarks")
@@ -18,7 +20,7 @@ def explore_mlperf_website():
     url = "https://mlcommons.org/en/inference/"
     
     try:
-        response = requests.get(url, timeout=10)
+        response = session.get(url, timeout=10)
         print(f"Status: {response.status_code}")
         print(f"Content-Type: {response.headers.get('content-type', 'Unknown')}")
         
@@ -67,7 +69,7 @@ def explore_mlperf_results():
     
     for url in test_urls:
         try:
-            response = requests.get(url, timeout=10)
+            response = session.get(url, timeout=10)
             print(f"\n🔗 {url}")
             print(f"   Status: {response.status_code}")
             
@@ -116,7 +118,7 @@ def explore_mlperf_github():
     
     for url in github_urls:
         try:
-            response = requests.get(url, timeout=10)
+            response = session.get(url, timeout=10)
             print(f"\n🔗 {url}")
             print(f"   Status: {response.status_code}")
             
@@ -10,6 +10,8 @@ import time
 import pandas as pd
 from io import StringIO
 
+session = requests.Session()
+
 def explore_company_directory(company_name):
     """Explore a specific company's benchmark data"""
     print(f"\n🔍 Exploring {company_name.upper()} Benchmark Data")
@@ -18,7 +20,7 @@ def explore_company_directory(company_name):
     company_url = f"https://api.github.com/repos/mlcommons/training_results_v0.5/contents/v0.5.0/{company_name}"
     
     try:
-        response = requests.get(company_url, timeout=10)
+        response = session.get(company_url, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -76,7 +78,7 @@ def explore_benchmark_directory(company_name, benchmark_dir):
         return
     
     try:
-        response = requests.get(dir_url, timeout=10)
+        response = session.get(dir_url, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -120,7 +122,7 @@ def download_data_file(company_name, file_item):
         return
     
     try:
-        response = requests.get(download_url, timeout=10)
+        response = session.get(download_url, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -147,9 +149,10 @@ def download_data_file(company_name, file_item):
                     print(f"\n📊 Sample data:")
                     print(df[competitive_cols].head())
                 
-                # Save the data
+                # Save the raw downloaded bytes
                 filename = f"data/raw/mlperf_{company_name}_{file_item.get('name')}"
-                df.to_csv(filename, index=False)
+                with open(filename, 'wb') as f:
+                    f.write(response.content)
                 print(f"💾 Data saved to: {filename}")
                 
                 return df
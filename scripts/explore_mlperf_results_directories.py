@@ -10,6 +10,8 @@ import time
 import pandas as pd
 from io import StringIO
 
+session = requests.Session()
+
 def explore_results_directory(company_name, benchmark_name):
     """Explore results directory for a specific benchmark"""
     print(f"\n🔍 Exploring {company_name.upper()} Results: {benchmark_name}")
@@ -18,7 +20,7 @@ def explore_results_directory(company_name, benchmark_name):
     results_url = f"https://api.github.com/repos/mlcommons/training_results_v0.5/contents/v0.5.0/{company_name}/{benchmark_name}/results"
     
     try:
-        response = requests.get(results_url, timeout=10)
+        response = session.get(results_url, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -62,7 +64,7 @@ def download_results_file(company_name, benchmark_name, file_item):
         return
     
     try:
-        response = requests.get(download_url, timeout=10)
+        response = session.get(download_url, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -89,9 +91,10 @@ def download_results_file(company_name, benchmark_name, file_item):
                     print(f"\n📊 Sample data:")
                     print(df[competitive_cols].head())
                 
-                # Save the data
+                # Save the raw downloaded bytes
                 filename = f"data/raw/mlperf_{company_name}_{benchmark_name}_{file_item.get('name')}"
-                df.to_csv(filename, index=False)
+                with open(filename, 'wb') as f:
+                    f.write(response.content)
                 print(f"💾 Data saved to: {filename}")
                 
                 return df
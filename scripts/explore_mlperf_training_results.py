@@ -10,6 +10,8 @@ import time
 import pandas as pd
 from io import StringIO
 
+session = requests.Session()
+
 def explore_mlperf_training_results():
     """Explore MLPerf training results repository"""
     print("🔍 Exploring MLPerf Training Results")
@@ -19,7 +21,7 @@ def explore_mlperf_training_results():
     repo_url = "https://api.github.com/repos/mlcommons/training_results_v0.5"
     
     try:
-        response = requests.get(repo_url, timeout=10)
+        response = session.get(repo_url, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -31,7 +33,7 @@ def explore_mlperf_training_results():
             
             # Get repository contents
             contents_url = repo_data.get('contents_url', '').replace('{+path}', '')
-            contents_response = requests.get(contents_url, timeout=10)
+            contents_response = session.get(contents_url, timeout=10)
             
             if contents_response.status_code == 200:
                 contents = contents_response.json()
@@ -76,7 +78,7 @@ def explore_mlperf_benchmark_data():
     
     for url in benchmark_urls:
         try:
-            response = requests.get(url, timeout=10)
+            response = session.get(url, timeout=10)
             print(f"\n🔗 {url}")
             print(f"   Status: {response.status_code}")
             
@@ -130,7 +132,7 @@ def explore_mlperf_submissions():
     
     for url in submission_urls:
         try:
-            response = requests.get(url, timeout=10)
+            response = session.get(url, timeout=10)
             print(f"\n🔗 {url}")
             print(f"   Status: {response.status_code}")
             
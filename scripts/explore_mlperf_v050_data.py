@@ -10,6 +10,8 @@ import time
 import pandas as pd
 from io import StringIO
 
+session = requests.Session()
+
 def explore_mlperf_v050_directory():
     """Explore the v0.5.0 directory for benchmark data"""
     print("🔍 Exploring MLPerf v0.5.0 Directory")
@@ -19,7 +21,7 @@ def explore_mlperf_v050_directory():
     v050_url = "https://api.github.com/repos/mlcommons/training_results_v0.5/contents/v0.5.0"
     
     try:
-        response = requests.get(v050_url, timeout=10)
+        response = session.get(v050_url, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -77,7 +79,7 @@ def explore_benchmark_directory(benchmark_dir):
         return
     
     try:
-        response = requests.get(dir_url, timeout=10)
+        response = session.get(dir_url, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -121,7 +123,7 @@ def download_data_file(file_item):
         return
     
     try:
-        response = requests.get(download_url, timeout=10)
+        response = session.get(download_url, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -148,9 +150,10 @@ def download_data_file(file_item):
                     print(f"\n📊 Sample data:")
                     print(df[competitive_cols].head())
                 
-                # Save the data
+                # Save the raw downloaded bytes
                 filename = f"data/raw/mlperf_{file_item.get('name')}"
-                df.to_csv(filename, index=False)
+                with open(filename, 'wb') as f:
+                    f.write(response.content)
                 print(f"💾 Data saved to: {filename}")
                 
                 return df
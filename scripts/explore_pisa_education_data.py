@@ -7,8 +7,8 @@ Focus on competitive measurement data for SEF framework validation
 import requests
 import json
 import time
-import pandas as pd
-from io import StringIO
+
+session = requests.Session()
 
 def explore_pisa_website():
     """Explore PISA website for data access"""
@@ -19,7 +19,7 @@ def explore_pisa_website():
     url = "https://www.oecd.org/pisa/data/"
     
     try:
-        response = requests.get(url, timeout=10)
+        response = session.get(url, timeout=10)
         print(f"Status: {response.status_code}")
         print(f"Content-Type: {response.headers.get('content-type', 'Unknown')}")
         
@@ -64,7 +64,7 @@ def explore_pisa_database():
     
     for url in test_urls:
         try:
-            response = requests.get(url, timeout=10)
+            response = session.get(url, timeout=10)
             print(f"\n🔗 {url}")
             print(f"   Status: {response.status_code}")
             
@@ -109,7 +109,7 @@ def explore_pisa_api():
     
     for url in api_urls:
         try:
-            response = requests.get(url, timeout=10)
+            response = session.get(url, timeout=10)
             print(f"\n🔗 {url}")
             print(f"   Status: {response.status_code}")
             
@@ -12,6 +12,8 @@ import json
 from bs4 import BeautifulSoup
 import time
 
+session = requests.Session()
+
 def investigate_hospital_compare_page():
     """
     Investigate the Hospital Compare dataset page to find actual download links
@@ -24,7 +26,7 @@ def investigate_hospital_compare_page():
     
     try:
         print(f"Fetching: {url}")
-        response = requests.get(url, timeout=10)
+        response = session.get(url, timeout=10)
         
         if response.status_code == 200:
             html_content = response.text
@@ -101,7 +103,7 @@ def investigate_metric_pages():
     for url in metric_pages:
         print(f"\n🔍 Investigating: {url}")
         try:
-            response = requests.get(url, timeout=10)
+            response = session.get(url, timeout=10)
             
             if response.status_code == 200:
                 html_content = response.text
@@ -158,7 +160,7 @@ def test_download_links(download_links):
         
         try:
             # Use HEAD request to test without downloading
-            response = requests.head(link['full_url'], timeout=10)
+            response = session.head(link['full_url'], timeout=10)
             print(f"   Status: {response.status_code}")
             
             if response.status_code == 200:
@@ -202,7 +204,7 @@ def investigate_cms_data_portal_structure():
     
     try:
         print(f"Fetching main portal: {main_url}")
-        response = requests.get(main_url, timeout=10)
+        response = session.get(main_url, timeout=10)
         
         if response.status_code == 200:
             html_content = response.text
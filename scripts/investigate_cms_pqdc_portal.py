@@ -9,6 +9,8 @@ from bs4 import BeautifulSoup
 import json
 import time
 
+session = requests.Session()
+
 def investigate_pqdc_portal():
     """Investigate the PQDC portal structure and find data access methods"""
     print("🔍 Investigating CMS PQDC Portal")
@@ -18,7 +20,7 @@ def investigate_pqdc_portal():
     url = "https://data.cms.gov/provider-data/dataset/patient-safety-indicators"
     
     try:
-        response = requests.get(url, timeout=10)
+        response = session.get(url, timeout=10)
         print(f"Status: {response.status_code}")
         print(f"Content-Type: {response.headers.get('content-type')}")
         print(f"Content-Length: {len(response.content)} bytes")
@@ -87,7 +89,7 @@ def test_alternative_cms_endpoints():
     
     for url in test_urls:
         try:
-            response = requests.get(url, timeout=10)
+            response = session.get(url, timeout=10)
             print(f"\n🔗 {url}")
             print(f"   Status: {response.status_code}")
             print(f"   Content-Type: {response.headers.get('content-type', 'Unknown')}")
@@ -14,7 +14,7 @@ import pandas as pd
 import numpy as np
 import os
 from scipy import stats
-from scipy.stats import shapiro, kstest, normaltest
+from scipy.stats import shapiro
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -60,13 +60,17 @@ def log_transform_validation():
                 print("✗ Insufficient categories")
                 continue
             
+            # Split rows by category once and reuse the subsets for every column
+            group1 = numeric_data[data[cat_col] == categories[0]]
+            group2 = numeric_data[data[cat_col] == categories[1]]
+            
             # Test each numeric column
             for col in numeric_data.columns:
                 print(f"\n  Testing column: {col}")
                 
                 # Get data for each category
-                data1 = numeric_data[data[cat_col] == categories[0]][col].dropna()
-                data2 = numeric_data[data[cat_col] == categories[1]][col].dropna()
+                data1 = group1[col].dropna()
+                data2 = group2[col].dropna()
                 
                 if len(data1) < 10 or len(data2) < 10:
                     print("    ✗ Insufficient data for analysis")
@@ -127,13 +131,13 @@ def test_data_quality(data1, data2, data_type):
     print(f"        Group 1: p={sw1_p:.3f}, Normal: {sw1_p > 0.05}")
     print(f"        Group 2: p={sw2_p:.3f}, Normal: {sw2_p > 0.05}")
     
-    # Calculate basic statistics
+    # Calculate basic statistics (std derived from var, not recomputed)
     stats_dict['mean1'] = data1.mean()
     stats_dict['mean2'] = data2.mean()
     stats_dict['var1'] = data1.var()
     stats_dict['var2'] = data2.var()
-    stats_dict['std1'] = data1.std()
-    stats_dict['std2'] = data2.std()
+    stats_dict['std1'] = np.sqrt(stats_dict['var1'])
+    stats_dict['std2'] = np.sqrt(stats_dict['var2'])
     
     # Calculate variance ratio (κ)
     stats_dict['kappa'] = stats_dict['var2'] / stats_dict['var1']
@@ -258,19 +258,11 @@ export_table.outcome_binary = analysis_data.outcome_binary;
 export_table.final_points_absolute = analysis_data.final_points_absolute;
 export_table.final_points_relative = analysis_data.final_points_relative;
 
-% Add absolute features
-for i = 1:length(absolute_feature_names)
-    metric = absolute_feature_names{i};
-    col_name = ['abs_' metric];
-    export_table.(col_name) = analysis_data.absolute_features(:, i);
-end
-
-% Add relative features
-for i = 1:length(relative_feature_names)
-    metric = relative_feature_names{i};
-    col_name = ['rel_' metric];
-    export_table.(col_name) = analysis_data.relative_features(:, i);
-end
+% Add absolute and relative features as one block of columns rather
+% than assigning them to the table one variable at a time
+feature_table = array2table([analysis_data.absolute_features, analysis_data.relative_features], ...
+    'VariableNames', [strcat('abs_', absolute_feature_names), strcat('rel_', relative_feature_names)]);
+export_table = [export_table, feature_table];
 
 writetable(export_table, csv_file);
 fprintf('  ✓ Saved CSV file: %s\n', csv_file);
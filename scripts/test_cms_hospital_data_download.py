@@ -10,6 +10,8 @@ import zipfile
 import io
 import time
 
+session = requests.Session()
+
 def test_hac_measures_download():
     """Test downloading Hospital-Acquired Condition Measures data"""
     print("🏥 Testing Hospital-Acquired Condition Measures Download")
@@ -20,7 +22,7 @@ def test_hac_measures_download():
     
     try:
         print(f"🔗 Downloading: {url}")
-        response = requests.get(url, timeout=30)
+        response = session.get(url, timeout=30)
         print(f"Status: {response.status_code}")
         print(f"Content-Type: {response.headers.get('content-type', 'Unknown')}")
         print(f"Content-Length: {len(response.content)} bytes")
@@ -34,8 +36,8 @@ def test_hac_measures_download():
                     f.write(response.content)
                 print(f"✅ Downloaded to: {filename}")
                 
-                # Try to read with pandas
-                df = pd.read_csv(filename)
+                # Parse the downloaded bytes directly instead of re-reading the file
+                df = pd.read_csv(io.BytesIO(response.content))
                 print(f"📊 CSV loaded successfully:")
                 print(f"   Rows: {len(df)}")
                 print(f"   Columns: {len(df.columns)}")
@@ -98,7 +100,7 @@ def test_other_hospital_datasets():
     
     try:
         print(f"🔗 Testing AHRQ PSI-11 data: {ahrq_url}")
-        response = requests.get(ahrq_url, timeout=30)
+        response = session.get(ahrq_url, timeout=30)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -107,8 +109,8 @@ def test_other_hospital_datasets():
                 f.write(response.content)
             print(f"✅ Downloaded to: {filename}")
             
-            # Try to read with pandas
-            df = pd.read_csv(filename)
+            # Parse the downloaded bytes directly instead of re-reading the file
+            df = pd.read_csv(io.BytesIO(response.content))
             print(f"📊 AHRQ PSI-11 data:")
             print(f"   Rows: {len(df)}")
             print(f"   Columns: {len(df.columns)}")
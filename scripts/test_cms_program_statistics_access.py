@@ -12,6 +12,8 @@ import pandas as pd
 import time
 from datetime import datetime
 
+session = requests.Session()
+
 def test_cms_program_statistics_access():
     """
     Test accessing CMS Program Statistics data
@@ -34,7 +36,7 @@ def test_cms_program_statistics_access():
     for url in program_stats_urls:
         print(f"\nTesting: {url}")
         try:
-            response = requests.get(url, timeout=10)
+            response = session.get(url, timeout=10)
             print(f"  Status: {response.status_code}")
             
             if response.status_code == 200:
@@ -47,13 +49,14 @@ def test_cms_program_statistics_access():
                     print(f"  📄 HTML content: {len(html_content)} characters")
                     
                     # Look for download links or data access information
-                    if 'download' in html_content.lower():
+                    page_text = html_content.lower()
+                    if 'download' in page_text:
                         print(f"  📥 Download references found")
-                    if 'csv' in html_content.lower():
+                    if 'csv' in page_text:
                         print(f"  📊 CSV references found")
-                    if 'api' in html_content.lower():
+                    if 'api' in page_text:
                         print(f"  🔌 API references found")
-                    if 'hospital' in html_content.lower():
+                    if 'hospital' in page_text:
                         print(f"  🏥 Hospital data references found")
                 
                 accessible_urls.append(url)
@@ -107,7 +110,7 @@ def test_hospital_specific_data_access():
         for url in test_urls:
             print(f"  Testing: {url}")
             try:
-                response = requests.get(url, timeout=10)
+                response = session.get(url, timeout=10)
                 print(f"    Status: {response.status_code}")
                 
                 if response.status_code == 200:
@@ -168,7 +171,7 @@ def test_quality_measures_access():
         for url in test_urls:
             print(f"  Testing: {url}")
             try:
-                response = requests.get(url, timeout=10)
+                response = session.get(url, timeout=10)
                 print(f"    Status: {response.status_code}")
                 
                 if response.status_code == 200:
@@ -210,7 +213,7 @@ def test_direct_data_downloads():
         print(f"\nTesting: {url}")
         try:
             # Use HEAD request to test without downloading
-            response = requests.head(url, timeout=10)
+            response = session.head(url, timeout=10)
             print(f"  Status: {response.status_code}")
             
             if response.status_code == 200:
@@ -111,8 +111,8 @@ def validate_dataset_structure(data, dataset_name):
         result['invalid_reason'] = f"Insufficient sample size: {len(data)} (minimum: 20)"
         return result
     
-    # Check for missing values
-    missing_rate = data.isnull().sum().sum() / (len(data) * len(data.columns))
+    # Check for missing values (count() avoids materialising a boolean frame)
+    missing_rate = (data.size - data.count().sum()) / data.size
     if missing_rate > 0.1:
         result['invalid_reason'] = f"High missing rate: {missing_rate:.1%} (maximum: 10%)"
         return result
@@ -165,6 +165,10 @@ def analyze_correlation_structure(data, dataset_name):
     
     print(f"  Categories found: {', '.join(map(str, categories))}")
     
+    # Split numeric data by category in a single grouped pass
+    category_data = dict(tuple(numeric_data.groupby(data[cat_col], sort=False)))
+    empty_data = numeric_data.iloc[0:0]
+    
     # Analyze each pair of categories
     correlations = []
     correlation_pairs = []
@@ -175,8 +179,8 @@ def analyze_correlation_structure(data, dataset_name):
             cat2 = categories[j]
             
             # Get data for each category
-            data1 = numeric_data[data[cat_col] == cat1]
-            data2 = numeric_data[data[cat_col] == cat2]
+            data1 = category_data.get(cat1, empty_data)
+            data2 = category_data.get(cat2, empty_data)
             
             if len(data1) < 10 or len(data2) < 10:
                 continue  # Skip pairs with insufficient data
@@ -311,38 +315,39 @@ def generate_validation_report(validation_results):
     sef_ready_datasets = 0
     
     for dataset_name, result in validation_results.items():
-        print(f"Dataset: {dataset_name}")
+        # Collect each dataset's report and write it with a single print
+        lines = [f"Dataset: {dataset_name}"]
         
         if result['valid_structure']:
-            print("  ✓ Structure: Valid")
-            print(f"    Sample size: {result['sample_size']}")
-            print(f"    Missing rate: {result['missing_rate']:.1%}")
-            print(f"    Numeric columns: {result['numeric_columns']}")
-            print(f"    Categorical columns: {result['categorical_columns']}")
+            lines.append("  ✓ Structure: Valid")
+            lines.append(f"    Sample size: {result['sample_size']}")
+            lines.append(f"    Missing rate: {result['missing_rate']:.1%}")
+            lines.append(f"    Numeric columns: {result['numeric_columns']}")
+            lines.append(f"    Categorical columns: {result['categorical_columns']}")
             
             valid_datasets += 1
             
             if 'correlation_analysis' in result and result['correlation_analysis']['valid_for_sef']:
-                print(f"  ✓ Correlation: Suitable for SEF (mean ρ = {result['correlation_analysis']['mean_correlation']:.3f})")
+                lines.append(f"  ✓ Correlation: Suitable for SEF (mean ρ = {result['correlation_analysis']['mean_correlation']:.3f})")
                 sef_ready_datasets += 1
             else:
-                print("  ✗ Correlation: Not suitable for SEF")
+                lines.append("  ✗ Correlation: Not suitable for SEF")
                 if 'correlation_analysis' in result:
-                    print(f"    Reason: {result['correlation_analysis']['reason']}")
+                    lines.append(f"    Reason: {result['correlation_analysis']['reason']}")
             
             if 'normality_analysis' in result:
-                print("  ✓ Normality: Tested")
+                lines.append("  ✓ Normality: Tested")
             
             if 'sef_analysis' in result and result['sef_analysis']['valid']:
-                print("  ✓ SEF: Calculation feasible")
+                lines.append("  ✓ SEF: Calculation feasible")
             else:
-                print("  ✗ SEF: Calculation not feasible")
+                lines.append("  ✗ SEF: Calculation not feasible")
             
         else:
-            print("  ✗ Structure: Invalid")
-            print(f"    Reason: {result['invalid_reason']}")
+            lines.append("  ✗ Structure: Invalid")
+            lines.append(f"    Reason: {result['invalid_reason']}")
         
-        print()
+        print("\n".join(lines) + "\n")
     
     print("=== SUMMARY ===")
     print(f"Total datasets: {len(validation_results)}")
@@ -217,31 +217,30 @@ function [abs_performance, rel_performance] = performCrossValidation(abs_feature
     abs_scores = zeros(cv_folds, n_metrics);
     rel_scores = zeros(cv_folds, n_metrics);
     
-    % Create cross-validation indices
-    cv_indices = crossvalind('HoldOut', n_samples, test_size);
+    % Create cross-validation indices (every fold's split is drawn up front
+    % and shared by the absolute and relative models)
+    test_masks = false(n_samples, cv_folds);
+    for fold = 1:cv_folds
+        test_masks(:, fold) = crossvalind('HoldOut', n_samples, test_size);
+    end
     
     for fold = 1:cv_folds
         % Split data
-        if fold == 1
-            % Use the first split
-            train_idx = ~cv_indices;
-            test_idx = cv_indices;
-        else
-            % Create new random split for additional folds
-            temp_indices = crossvalind('HoldOut', n_samples, test_size);
-            train_idx = ~temp_indices;
-            test_idx = temp_indices;
-        end
+        test_idx = test_masks(:, fold);
+        train_idx = ~test_idx;
+        train_outcome = outcome(train_idx);
+        test_outcome = outcome(test_idx);
         
-        % Train and test absolute model
-        abs_model = fitglm(abs_features(train_idx), outcome(train_idx), 'Distribution', 'binomial');
-        abs_pred = predict(abs_model, abs_features(test_idx));
-        abs_scores(fold, :) = calculateMetrics(abs_pred, outcome(test_idx), performance_metrics);
+        % Train and test absolute model (glmfit/glmval: same logistic fit
+        % as fitglm without building a GeneralizedLinearModel each fold)
+        abs_coef = glmfit(abs_features(train_idx), double(train_outcome), 'binomial');
+        abs_pred = glmval(abs_coef, abs_features(test_idx), 'logit');
+        abs_scores(fold, :) = calculateMetrics(abs_pred, test_outcome, performance_metrics);
         
         % Train and test relative model
-        rel_model = fitglm(rel_features(train_idx), outcome(train_idx), 'Distribution', 'binomial');
-        rel_pred = predict(rel_model, rel_features(test_idx));
-        rel_scores(fold, :) = calculateMetrics(rel_pred, outcome(test_idx), performance_metrics);
+        rel_coef = glmfit(rel_features(train_idx), double(train_outcome), 'binomial');
+        rel_pred = glmval(rel_coef, rel_features(test_idx), 'logit');
+        rel_scores(fold, :) = calculateMetrics(rel_pred, test_outcome, performance_metrics);
     end
     
     % Aggregate results across folds
@@ -416,13 +415,10 @@ function [aggregate_results, metric_summary] = compareAggregatePerformance(metri
     metric_summary.performance_metrics = performance_metrics;
     
     % Calculate overall improvement across all metrics
-    all_improvements = [];
-    for i = 1:n_metrics
-        metric = performance_metrics{i};
-        if isfield(aggregate_results, metric)
-            all_improvements = [all_improvements; aggregate_results.(metric).improvement_mean];
-        end
-    end
+    has_aggregate = isfield(aggregate_results, performance_metrics);
+    all_improvements = cellfun(@(m) aggregate_results.(m).improvement_mean, ...
+                               performance_metrics(has_aggregate));
+    all_improvements = all_improvements(:);
     
     if ~isempty(all_improvements)
         metric_summary.mean_improvement = all_improvements;
@@ -490,23 +486,24 @@ function effect_sizes = calculateEffectSizes(metric_results, performance_metrics
     for i = 1:n_metrics
         metric = performance_metrics{i};
         
-        % Collect all scores for this metric
-        all_abs_scores = [];
-        all_rel_scores = [];
+        % Collect all scores for this metric, concatenating once after
+        % the loop rather than growing the arrays on every iteration
+        abs_score_sets = cell(n_available_metrics, 1);
+        rel_score_sets = cell(n_available_metrics, 1);
         
         for j = 1:n_available_metrics
             metric_name = metric_names{j};
             if isfield(metric_results.(metric_name), 'relative') && ...
                isfield(metric_results.(metric_name), 'absolute')
                 
-                abs_scores = metric_results.(metric_name).absolute.(metric).scores;
-                rel_scores = metric_results.(metric_name).relative.(metric).scores;
-                
-                all_abs_scores = [all_abs_scores; abs_scores];
-                all_rel_scores = [all_rel_scores; rel_scores];
+                abs_score_sets{j} = metric_results.(metric_name).absolute.(metric).scores;
+                rel_score_sets{j} = metric_results.(metric_name).relative.(metric).scores;
             end
         end
         
+        all_abs_scores = vertcat(abs_score_sets{:});
+        all_rel_scores = vertcat(rel_score_sets{:});
+        
         % Calculate Cohen's d
         if length(all_abs_scores) > 1 && length(all_rel_scores) > 1
             pooled_std = sqrt(((length(all_abs_scores) - 1) * var(all_abs_scores) + ...
@@ -202,10 +202,8 @@ try
         grid on;
         
         % Add value labels
-        for i = 1:2
-            text(i, comparison_data(i) + 0.05, sprintf('%.3f', comparison_data(i)), ...
-                 'HorizontalAlignment', 'center', 'FontWeight', 'bold');
-        end
+        text((1:2)', comparison_data(:) + 0.05, compose('%.3f', comparison_data(:)), ...
+             'HorizontalAlignment', 'center', 'FontWeight', 'bold');
         
         % Add gap analysis
         gap = theoretical_prediction - 1.122;
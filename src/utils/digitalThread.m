@@ -618,13 +618,16 @@ end
             report = [report, sprintf('\n')];
             
             % Execution Log
-            report = [report, sprintf('=== EXECUTION LOG ===\n')];
+            % The log grows with the session, so format every event into a
+            % preallocated cell array and join once
             event_ids = fieldnames(obj.execution_log);
+            event_lines = cell(1, length(event_ids));
             for i = 1:length(event_ids)
                 event = obj.execution_log.(event_ids{i});
-                report = [report, sprintf('[%s] %s: %s\n', ...
-                    datestr(event.timestamp), event.event_type, event.message)];
+                event_lines{i} = sprintf('[%s] %s: %s\n', ...
+                    datestr(event.timestamp), event.event_type, event.message);
             end
+            report = [report, sprintf('=== EXECUTION LOG ===\n'), event_lines{:}];
             
             % Footer
             report = [report, sprintf('\n=== END OF REPORT ===\n')];